@@ -1 +0,0 @@
-"""Reporting utilities."""
@@ -0,0 +1,640 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from scipy.stats import chi2_contingency
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.analysis.associations import association_matrix  # noqa: E402
+from src.analysis.metrics import build_metrics, kpi_values, read_metrics  # noqa: E402
+from src.analysis.resampling import (  # noqa: E402
+    DEFAULT_RESAMPLES,
+    DEFAULT_SEED,
+    bootstrap_share_ci,
+    permutation_p_value,
+)
+from src.data.artifacts import dataset_is_current, read_manifest  # noqa: E402
+from src.data.bitmap_index import RowIndex  # noqa: E402
+from src.data.cube import (  # noqa: E402
+    build_cube,
+    cube_anxiety_table,
+    cube_count,
+    cube_counts,
+    cube_crosstab,
+    cube_means,
+    cube_share,
+    cube_total,
+    read_cube,
+)
+from src.data.partitions import partitioned_columns, read_partitioned  # noqa: E402
+from src.i18n.translations import DEFAULT_LANGUAGE, LANGUAGES, Translator  # noqa: E402
+
+PARQUET_PATH = PROJECT_ROOT / "data/processed/survey_analytics.parquet"
+CSV_PATH = PROJECT_ROOT / "data/processed/survey_analytics.csv"
+CUBE_PATH = PROJECT_ROOT / "data/processed/survey_cube.parquet"
+ASSOCIATIONS_PATH = PROJECT_ROOT / "data/processed/survey_associations.parquet"
+MANIFEST_PATH = PROJECT_ROOT / "data/processed/manifest.json"
+METRICS_PATH = PROJECT_ROOT / "data/processed/survey_metrics.json"
+PARTITIONED_PATH = PROJECT_ROOT / "data/processed/survey_analytics_by_month"
+DASHBOARD_COLUMNS = [
+    "timestamp",
+    "gender",
+    "q3_impact",
+    "q4_problems",
+    "q10_stress",
+    "q14_anxiety",
+    "q15_wellbeing_final",
+    "q10_stress_score",
+    "q11_optimism_score",
+    "q12_control_score",
+    "q13_protocols_score",
+    "q14_anxiety_score",
+    "q15_wellbeing_score",
+]
+COLORWAY = ["#0B132B", "#1C2541", "#3A506B", "#5BC0BE", "#F4A259", "#E07A5F"]
+DATA_CACHE_ENTRIES = 2
+VIEW_CACHE_ENTRIES = 256
+EXPORT_CACHE_ENTRIES = 16
+MAX_RESAMPLES = 1_000_000
+# Stands in for missing answers in the cached counts until the chart labels are translated.
+MISSING_LABEL = "__missing__"
+FilterKey = tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[dt.date, dt.date] | None]
+
+
+def inject_styles() -> None:
+    st.markdown(
+        """
+        <style>
+        @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&family=IBM+Plex+Sans:wght@400;500;600&display=swap');
+
+        :root {
+            --ink: #0b132b;
+            --ink-soft: #3a506b;
+            --teal: #5bc0be;
+            --orange: #f4a259;
+            --paper: #f9fbfd;
+        }
+
+        .stApp {
+            background: radial-gradient(1000px 400px at 0% 0%, rgba(91,192,190,.18), rgba(91,192,190,0) 60%),
+                        radial-gradient(900px 500px at 100% 0%, rgba(244,162,89,.15), rgba(244,162,89,0) 55%),
+                        var(--paper);
+            color: var(--ink);
+            font-family: "IBM Plex Sans", sans-serif;
+        }
+
+        h1, h2, h3 {
+            font-family: "Space Grotesk", sans-serif !important;
+            letter-spacing: -0.02em;
+        }
+
+        .hero-card {
+            border: 1px solid rgba(11,19,43,.12);
+            border-radius: 18px;
+            padding: 18px 20px;
+            background: rgba(255,255,255,.9);
+            box-shadow: 0 8px 30px rgba(11,19,43,.06);
+            animation: fadein .5s ease-out;
+        }
+
+        .hero-kicker {
+            font-size: .82rem;
+            color: var(--ink-soft);
+            text-transform: uppercase;
+            letter-spacing: .08em;
+            margin-bottom: .3rem;
+        }
+
+        .hero-title {
+            font-size: 1.6rem;
+            font-weight: 700;
+            margin: 0;
+            color: var(--ink);
+        }
+
+        .hero-sub {
+            margin-top: .45rem;
+            color: var(--ink-soft);
+        }
+
+        @keyframes fadein {
+            from { opacity: 0; transform: translateY(6px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+
+def data_path() -> Path | None:
+    for path in (PARQUET_PATH, CSV_PATH):
+        if path.exists():
+            return path
+    return None
+
+
+# `version` changes when the pipeline publishes new outputs, so a running dashboard reloads them on the
+# next rerun; the previous generation stays cached until it is evicted.
+@st.cache_data(max_entries=DATA_CACHE_ENTRIES, show_spinner=False)
+def load_data(path: Path, version: str) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        # Project to the dashboard columns and memory-map the file; dtypes come from the Parquet schema.
+        available = set(pq.read_schema(path).names)
+        columns = [col for col in DASHBOARD_COLUMNS if col in available]
+        return pq.read_table(path, columns=columns, memory_map=True).to_pandas()
+
+    header = pd.read_csv(path, nrows=0).columns
+    df = pd.read_csv(path, usecols=[col for col in DASHBOARD_COLUMNS if col in header])
+
+    if "timestamp" in df.columns:
+        df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+
+    replace_map = {
+        "Si": "Si",
+        "S\u00ed": "Si",
+        "Negativa.": "Negativa",
+        "Positiva.": "Positiva",
+        "Siempre.": "Siempre",
+    }
+    for col in ["q3_impact", "q4_problems", "q15_wellbeing_final", "q10_stress", "q14_anxiety"]:
+        if col in df.columns:
+            df[col] = df[col].replace(replace_map)
+
+    return df
+
+
+@st.cache_data(max_entries=DATA_CACHE_ENTRIES, show_spinner=False)
+def load_cube(path: Path, data: Path, version: str) -> pd.DataFrame:
+    # The pipeline writes the cube; rebuild it from the rows when only the processed file exists.
+    if path.exists():
+        return read_cube(path)
+    return build_cube(load_data(data, version))
+
+
+@st.cache_data(show_spinner=False)
+def load_associations(path: Path, version: str) -> pd.DataFrame | None:
+    # Precomputed by the pipeline over the full sample; the dashboard does not recompute it.
+    if not path.exists():
+        return None
+    return pd.read_parquet(path)
+
+
+@st.cache_data(show_spinner=False)
+def load_metrics(path: Path, _cube: pd.DataFrame, version: str) -> dict:
+    # Published by clean_survey.py; outputs from older pipeline runs fall back to the cube.
+    metrics = read_metrics(path)
+    return metrics if metrics is not None else build_metrics(_cube)
+
+
+@st.cache_resource(show_spinner=False)
+def load_index(_df: pd.DataFrame, version: str, time_col: str = "timestamp") -> RowIndex:
+    # cache_resource keeps one shared index object instead of unpickling a copy per rerun.
+    return RowIndex(_df, time_col=time_col)
+
+
+def selections(key: FilterKey) -> dict[str, tuple[str, ...]]:
+    sel_gender, sel_impact, sel_wellbeing, _ = key
+    return {"gender": sel_gender, "q3_impact": sel_impact, "q15_wellbeing_final": sel_wellbeing}
+
+
+def chi_square(table: pd.DataFrame, test: str) -> dict[str, float | int | str]:
+    n = int(table.to_numpy().sum())
+    if table.shape[0] < 2 or table.shape[1] < 2:
+        return {"test": test, "chi2": np.nan, "p_value": np.nan, "dof": np.nan, "n": n}
+    chi2, p_val, dof, _ = chi2_contingency(table)
+    return {"test": test, "chi2": chi2, "p_value": p_val, "dof": dof, "n": n}
+
+
+def filter_key(
+    gender: list[str],
+    impact: list[str],
+    wellbeing: list[str],
+    date_window: tuple[dt.date, dt.date] | None,
+) -> FilterKey:
+    # Selection order in the multiselects does not change the result, so sort it out of the key.
+    return (tuple(sorted(gender)), tuple(sorted(impact)), tuple(sorted(wellbeing)), date_window)
+
+
+def data_version(*paths: Path) -> str:
+    # Published files are keyed by their manifest checksum, so a run that is still writing (manifest not
+    # yet updated) never invalidates the caches; files outside the manifest fall back to their mtime.
+    manifest = read_manifest(MANIFEST_PATH)
+    entries = manifest["artifacts"] if manifest is not None else {}
+    parts = []
+    for path in paths:
+        entry = entries.get(path.relative_to(PROJECT_ROOT).as_posix())
+        if entry is not None:
+            # Directory artifacts carry the checksum of the file they were built from.
+            parts.append(f"{path}:{entry.get('sha256', entry.get('source_sha256'))}")
+        elif path.exists():
+            parts.append(f"{path}:{path.stat().st_mtime_ns}")
+    return ";".join(parts)
+
+
+# st.cache_data is process-wide, so these entries are shared by every session; max_entries
+# bounds the cache and evicts the least recently used selection first. Leading-underscore
+# arguments are not hashed: the data version string stands in for them in the key.
+# The statistics are language-neutral, so both audiences hit the same entries; only the
+# figures, which carry translated titles and labels, are cached per language.
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, show_spinner=False)
+def build_view(
+    _cube: pd.DataFrame, _cube_index: RowIndex, version: str, has: frozenset[str], key: FilterKey
+) -> dict[str, object]:
+    view = _cube.take(_cube_index.select(selections(key), key[3]))
+    n_view = cube_total(view)
+    charts: dict[str, pd.Series | pd.DataFrame] = {}
+
+    if "q3_impact" in has:
+        charts["impact"] = cube_counts(view, "q3_impact", missing_label=MISSING_LABEL)
+
+    if "q15_wellbeing_final" in has:
+        order = ["No", "Tal vez", "Si", "Prefiero no responder."]
+        wellbeing = cube_counts(view, "q15_wellbeing_final", missing_label=MISSING_LABEL)
+        charts["wellbeing"] = wellbeing.reindex(order + [MISSING_LABEL], fill_value=0)
+
+    if {"gender", "q15_wellbeing_final"}.issubset(has):
+        ctab = cube_crosstab(view, "gender", "q15_wellbeing_final")
+        charts["stack"] = ctab.div(ctab.sum(axis=1), axis=0)
+
+    if {"q4_problems", "q15_wellbeing_final"}.issubset(has):
+        charts["heat"] = cube_crosstab(view, "q4_problems", "q15_wellbeing_final")
+
+    score_cols = [
+        "q10_stress_score",
+        "q11_optimism_score",
+        "q12_control_score",
+        "q13_protocols_score",
+        "q14_anxiety_score",
+    ]
+    score_cols = [c for c in score_cols if c in has]
+    if score_cols:
+        charts["scores"] = cube_means(view, score_cols).round(2)
+
+    tables: dict[str, pd.DataFrame] = {}
+    if {"q3_impact", "q15_wellbeing_final"}.issubset(has):
+        tables["q3_impact vs q15_wellbeing_final"] = cube_crosstab(view, "q3_impact", "q15_wellbeing_final")
+    if {"q4_problems", "q15_wellbeing_final"}.issubset(has):
+        tables["q4_problems vs q15_wellbeing_final"] = cube_crosstab(view, "q4_problems", "q15_wellbeing_final")
+    if {"q4_problems", "q14_anxiety_score"}.issubset(has):
+        tables["q4_problems vs anxiety_high"] = cube_anxiety_table(view, "q4_problems")
+
+    test_rows = [chi_square(table, test) for test, table in tables.items()]
+    tests_df = pd.DataFrame(test_rows)
+    if test_rows:
+        tests_df["significant"] = tests_df["p_value"] < 0.05
+
+    return {
+        "n": n_view,
+        "negative": cube_share(view, "q3_impact", ["Negativa"]) if "q3_impact" in has else np.nan,
+        "problems": cube_share(view, "q4_problems", ["Si"]) if "q4_problems" in has else np.nan,
+        "low_wellbeing": (
+            cube_share(view, "q15_wellbeing_final", ["No", "Tal vez"]) if "q15_wellbeing_final" in has else np.nan
+        ),
+        "anxiety_high": cube_total(view, "anxiety_high") / n_view * 100 if n_view else np.nan,
+        "charts": charts,
+        "tables": tables,
+        "tests": tests_df,
+    }
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, show_spinner=False)
+def view_figures(
+    _cube: pd.DataFrame, _cube_index: RowIndex, version: str, has: frozenset[str], key: FilterKey, lang: str
+) -> dict[str, go.Figure]:
+    t = Translator(lang)
+    charts = build_view(_cube, _cube_index, version, has, key)["charts"]
+    figures: dict[str, go.Figure] = {}
+
+    if "impact" in charts:
+        impact_count = charts["impact"].rename({MISSING_LABEL: t("chart.no_data")}).reset_index()
+        impact_count.columns = [t("chart.impact"), t("chart.count")]
+        fig_impact = px.bar(
+            impact_count,
+            x=t("chart.impact"),
+            y=t("chart.count"),
+            color=t("chart.impact"),
+            color_discrete_sequence=COLORWAY,
+            title=t("chart.impact_title"),
+        )
+        fig_impact.update_layout(showlegend=False, height=380)
+        figures["impact"] = fig_impact
+
+    if "wellbeing" in charts:
+        wellbeing_count = charts["wellbeing"].rename({MISSING_LABEL: t("chart.no_data")}).reset_index()
+        wellbeing_count.columns = [t("chart.wellbeing"), t("chart.count")]
+        fig_w = px.bar(
+            wellbeing_count,
+            x=t("chart.wellbeing"),
+            y=t("chart.count"),
+            color=t("chart.wellbeing"),
+            color_discrete_sequence=COLORWAY,
+            title=t("chart.wellbeing_title"),
+        )
+        fig_w.update_layout(showlegend=False, height=380)
+        figures["wellbeing"] = fig_w
+
+    if "stack" in charts:
+        ctab = charts["stack"]
+        fig_stack = go.Figure()
+        for i, col in enumerate(ctab.columns):
+            fig_stack.add_trace(
+                go.Bar(
+                    x=ctab.index,
+                    y=ctab[col],
+                    name=col,
+                    marker_color=COLORWAY[i % len(COLORWAY)],
+                )
+            )
+        fig_stack.update_layout(
+            barmode="stack",
+            title=t("chart.wellbeing_by_gender_title"),
+            yaxis_tickformat=".0%",
+            height=420,
+        )
+        figures["stack"] = fig_stack
+
+    if "heat" in charts:
+        fig_heat = px.imshow(
+            charts["heat"],
+            text_auto=True,
+            aspect="auto",
+            color_continuous_scale=[[0, "#F4F7FB"], [1, "#0B132B"]],
+            title=t("chart.problems_heatmap_title"),
+        )
+        fig_heat.update_layout(height=420)
+        figures["heat"] = fig_heat
+
+    if "scores" in charts:
+        mean_scores = charts["scores"].reset_index()
+        mean_scores.columns = ["Variable", t("chart.average")]
+        fig_scores = px.bar(
+            mean_scores,
+            x="Variable",
+            y=t("chart.average"),
+            color="Variable",
+            color_discrete_sequence=COLORWAY,
+            title=t("chart.scores_title"),
+        )
+        fig_scores.update_layout(showlegend=False, yaxis_range=[0, 4], height=360)
+        figures["scores"] = fig_scores
+
+    return figures
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, show_spinner=False)
+def resample_view(
+    _cube: pd.DataFrame,
+    _cube_index: RowIndex,
+    version: str,
+    has: frozenset[str],
+    key: FilterKey,
+    n_resamples: int,
+) -> dict[str, pd.DataFrame]:
+    # Permutation p-values stay valid for sparse tables where the asymptotic chi-square is not.
+    result = build_view(_cube, _cube_index, version, has, key)
+    tests = pd.DataFrame(
+        [
+            {"test": test, "perm_p_value": permutation_p_value(table.to_numpy(), n_resamples, DEFAULT_SEED)}
+            for test, table in result["tables"].items()
+        ]
+    )
+
+    view = _cube.take(_cube_index.select(selections(key), key[3]))
+    n_view = cube_total(view)
+    # Keyed by KPI name; the labels are translated when the table is shown.
+    counts: dict[str, int] = {}
+    if "q3_impact" in has:
+        counts["negative"] = cube_count(view, "q3_impact", ["Negativa"])
+    if "q4_problems" in has:
+        counts["problems"] = cube_count(view, "q4_problems", ["Si"])
+    if "q15_wellbeing_final" in has:
+        counts["low_wellbeing"] = cube_count(view, "q15_wellbeing_final", ["No", "Tal vez"])
+    if "q14_anxiety_score" in has:
+        counts["anxiety_high"] = cube_total(view, "anxiety_high")
+    kpi_rows = []
+    for kpi, count in counts.items():
+        low, high = bootstrap_share_ci(count, n_view, n_resamples, DEFAULT_SEED)
+        share = round(count / n_view * 100, 2) if n_view else np.nan
+        kpi_rows.append({"kpi": kpi, "value": share, "ci_95_low": low, "ci_95_high": high})
+    return {"tests": tests, "kpis": pd.DataFrame(kpi_rows)}
+
+
+@st.cache_data(max_entries=EXPORT_CACHE_ENTRIES, show_spinner=False)
+def export_csv(_df: pd.DataFrame, _index: RowIndex, version: str, key: FilterKey) -> bytes:
+    return _df.take(_index.select(selections(key), key[3])).to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(max_entries=EXPORT_CACHE_ENTRIES, show_spinner=False)
+def export_partitioned(path: Path, version: str, key: FilterKey) -> bytes:
+    # Filters are pushed into the scan: the date window prunes month partitions and row groups,
+    # so only the matching rows are read from disk.
+    rows = read_partitioned(path, DASHBOARD_COLUMNS, selections(key), key[3])
+    return rows.to_csv(index=False).encode("utf-8")
+
+
+def default_language() -> str:
+    # `streamlit run app/streamlit_app.py -- --lang es`, or DASHBOARD_LANG in the environment.
+    parser = argparse.ArgumentParser(add_help=False)
+    # An empty DASHBOARD_LANG counts as unset.
+    default = os.environ.get("DASHBOARD_LANG") or DEFAULT_LANGUAGE
+    parser.add_argument("--lang", choices=sorted(LANGUAGES), default=default)
+    args, _ = parser.parse_known_args()
+    return args.lang
+
+
+def dashboard_language() -> str:
+    # The sidebar switch wins, then `?lang=` in the URL (so links open in a language), then the
+    # process default. Sessions in either language share every data and statistics cache.
+    lang = st.session_state.get("lang") or st.query_params.get("lang")
+    return lang if lang in LANGUAGES else default_language()
+
+
+def main() -> None:
+    lang = dashboard_language()
+    t = Translator(lang)
+    st.set_page_config(page_title=t("page.title"), page_icon=":bar_chart:", layout="wide")
+    inject_styles()
+
+    codes = list(LANGUAGES)
+    st.sidebar.selectbox(
+        t("sidebar.language"), options=codes, index=codes.index(lang), format_func=LANGUAGES.get, key="lang"
+    )
+    st.query_params["lang"] = lang
+
+    path = data_path()
+    if path is None:
+        st.error(t("error.no_data"))
+        st.stop()
+
+    # With the partitioned dataset and the cube published, the rows are never loaded in full: every
+    # view comes from the cube and the export reads only the filtered rows. A dataset left over from
+    # an older run (its manifest entry names another version of the processed file) is ignored.
+    partitioned = (
+        PARTITIONED_PATH.is_dir()
+        and CUBE_PATH.exists()
+        and dataset_is_current(read_manifest(MANIFEST_PATH), PARTITIONED_PATH.relative_to(PROJECT_ROOT).as_posix())
+    )
+    version = data_version(path, CUBE_PATH, PARTITIONED_PATH)
+    cube = load_cube(CUBE_PATH, path, version)
+    cube_index = load_index(cube, version, time_col="day")
+    if partitioned:
+        df = row_index = None
+        base_n = cube_total(cube)
+        has = set(DASHBOARD_COLUMNS) & set(partitioned_columns(PARTITIONED_PATH))
+    else:
+        df = load_data(path, version)
+        row_index = load_index(df, version)
+        base_n = len(df)
+        has = set(df.columns)
+    headline = kpi_values(load_metrics(METRICS_PATH, cube, data_version(METRICS_PATH, CUBE_PATH)))
+
+    st.markdown(
+        f"""
+        <div class="hero-card">
+            <div class="hero-kicker">{t("hero.kicker")}</div>
+            <p class="hero-title">{t("hero.title")}</p>
+            <p class="hero-sub">{t("hero.subtitle", **headline)}</p>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    st.warning(t("disclaimer"))
+
+    st.info(t("snapshot", **headline))
+
+    st.sidebar.header(t("sidebar.filters"))
+    genders = sorted(cube["gender"].dropna().unique().tolist()) if "gender" in has else []
+    impacts = sorted(cube["q3_impact"].dropna().unique().tolist()) if "q3_impact" in has else []
+    wellbeings = (
+        sorted(cube["q15_wellbeing_final"].dropna().unique().tolist()) if "q15_wellbeing_final" in has else []
+    )
+
+    sel_gender = st.sidebar.multiselect(t("sidebar.gender"), options=genders, default=genders)
+    sel_impact = st.sidebar.multiselect(t("sidebar.impact"), options=impacts, default=impacts)
+    sel_wellbeing = st.sidebar.multiselect(t("sidebar.wellbeing"), options=wellbeings, default=wellbeings)
+
+    # The date bounds follow the category filters; everything else is computed (and cached) in build_view.
+    view = cube.take(cube_index.select(selections(filter_key(sel_gender, sel_impact, sel_wellbeing, None))))
+
+    window: tuple[dt.date, dt.date] | None = None
+    if "timestamp" in has and view["day"].notna().any():
+        min_d = view["day"].min().date()
+        max_d = view["day"].max().date()
+        date_window = st.sidebar.date_input(t("sidebar.date_range"), value=(min_d, max_d), min_value=min_d, max_value=max_d)
+        if isinstance(date_window, tuple) and len(date_window) == 2:
+            window = date_window
+
+    use_resampling = st.sidebar.toggle(t("sidebar.resampling"), value=False)
+    n_resamples = DEFAULT_RESAMPLES
+    if use_resampling:
+        n_resamples = int(
+            st.sidebar.number_input(
+                t("sidebar.resamples"),
+                min_value=1_000,
+                max_value=MAX_RESAMPLES,
+                value=DEFAULT_RESAMPLES,
+                step=1_000,
+            )
+        )
+
+    key = filter_key(sel_gender, sel_impact, sel_wellbeing, window)
+    result = build_view(cube, cube_index, version, frozenset(has), key)
+    n_view = result["n"]
+
+    st.sidebar.caption(t("sidebar.filtered", n_view=n_view, base_n=base_n))
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric(t("kpi.responses"), f"{n_view}")
+    col2.metric(t("kpi.negative"), f"{result['negative']:.2f}%" if "q3_impact" in has else "NA")
+    col3.metric(t("kpi.problems"), f"{result['problems']:.2f}%" if "q4_problems" in has else "NA")
+    col4.metric(t("kpi.low_wellbeing"), f"{result['low_wellbeing']:.2f}%")
+    if "q14_anxiety_score" in has:
+        col5.metric(t("kpi.anxiety_high"), f"{result['anxiety_high']:.2f}%")
+    else:
+        col5.metric(t("kpi.anxiety_high"), "NA")
+
+    st.markdown(t("section.overview"))
+    c1, c2 = st.columns(2)
+    figures = view_figures(cube, cube_index, version, frozenset(has), key, lang)
+    if "impact" in figures:
+        c1.plotly_chart(figures["impact"], use_container_width=True)
+    if "wellbeing" in figures:
+        c2.plotly_chart(figures["wellbeing"], use_container_width=True)
+
+    st.markdown(t("section.cross"))
+    c3, c4 = st.columns(2)
+    if "stack" in figures:
+        c3.plotly_chart(figures["stack"], use_container_width=True)
+    if "heat" in figures:
+        c4.plotly_chart(figures["heat"], use_container_width=True)
+
+    st.markdown(t("section.scores"))
+    if "scores" in figures:
+        st.plotly_chart(figures["scores"], use_container_width=True)
+
+    st.markdown(t("section.evidence"))
+    tests_df = result["tests"].rename(columns={"significant": t("tests.significant")})
+    resampled = None
+    if use_resampling:
+        with st.spinner(t("resampling.running")):
+            resampled = resample_view(cube, cube_index, version, frozenset(has), key, n_resamples)
+        if not tests_df.empty:
+            tests_df = tests_df.merge(resampled["tests"], on="test", how="left")
+    if not tests_df.empty:
+        st.dataframe(tests_df, use_container_width=True, hide_index=True)
+    if resampled is not None and not resampled["kpis"].empty:
+        st.caption(t("resampling.caption", n_resamples=n_resamples, seed=DEFAULT_SEED))
+        kpis = resampled["kpis"].assign(kpi=lambda d: d["kpi"].map(lambda name: t(f"kpi.{name}")))
+        st.dataframe(kpis, use_container_width=True, hide_index=True)
+
+    associations = load_associations(ASSOCIATIONS_PATH, data_version(ASSOCIATIONS_PATH))
+    if associations is not None and not associations.empty:
+        with st.expander(t("associations.expander")):
+            fig_assoc = px.imshow(
+                association_matrix(associations),
+                color_continuous_scale="Teal",
+                zmin=0,
+                zmax=1,
+                aspect="auto",
+                title=t("associations.title"),
+            )
+            st.plotly_chart(fig_assoc, use_container_width=True)
+            st.dataframe(
+                associations.sort_values("cramers_v", ascending=False),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+    st.markdown(t("section.export"))
+    if partitioned:
+        csv_data = export_partitioned(PARTITIONED_PATH, version, key)
+    else:
+        csv_data = export_csv(df, row_index, version, key)
+    st.download_button(
+        label=t("export.download"),
+        data=csv_data,
+        file_name="survey_filtered_dashboard.csv",
+        mime="text/csv",
+    )
+
+    st.caption(t("footer.note"))
+
+
+if __name__ == "__main__":
+    main()
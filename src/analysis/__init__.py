@@ -0,0 +1 @@
+"""Statistical analysis utilities."""
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2 as chi2_dist
+
+from src.data.schema import CATEGORY_ORDER
+
+
+# Every closed question q1..q15 (q8 is free text and has no category order).
+QUESTION_COLUMNS = [col for col in CATEGORY_ORDER if col.startswith("q")]
+# Upper bound on rows x pairs materialized per bincount call.
+MAX_CELLS_PER_CHUNK = 1 << 22
+
+
+class ContingencyAccumulator:
+    """Pairwise contingency tables for all question pairs, built with one bincount per row chunk.
+
+    Each column is encoded to integer codes once; the codes of every pair are offset into a
+    shared flat counts vector, so all tables are filled in a single vectorized pass. Tables are
+    additive, so batches (streaming runs) can be fed one at a time.
+    """
+
+    def __init__(self, columns: Sequence[str] = QUESTION_COLUMNS) -> None:
+        self.columns = list(columns)
+        self.categories: dict[str, list[object]] = {col: list(CATEGORY_ORDER.get(col, [])) for col in self.columns}
+        self.pairs = [(a, b) for i, a in enumerate(self.columns) for b in self.columns[i + 1 :]]
+        self.tables: dict[tuple[str, str], np.ndarray] = {}
+
+    def _encode(self, df: pd.DataFrame) -> np.ndarray:
+        codes = np.full((len(df), len(self.columns)), -1, dtype=np.int64)
+        for idx, col in enumerate(self.columns):
+            if col not in df.columns:
+                continue
+            series = df[col]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype("category")
+            # Remap the column's own category codes onto the accumulator's (growing) category list.
+            known = self.categories[col]
+            position = {value: pos for pos, value in enumerate(known)}
+            for value in series.cat.categories:
+                if value not in position:
+                    position[value] = len(known)
+                    known.append(value)
+            lookup = np.array([position[value] for value in series.cat.categories] + [-1], dtype=np.int64)
+            codes[:, idx] = lookup[series.cat.codes.to_numpy()]
+        return codes
+
+    def update(self, df: pd.DataFrame) -> None:
+        if df.empty or not self.pairs:
+            return
+        codes = self._encode(df)
+        sizes = np.array([len(self.categories[col]) for col in self.columns], dtype=np.int64)
+        # Missing answers get an extra trailing code per column, so no masking is needed in the
+        # hot loop; that last row/column is sliced off each table afterwards.
+        codes[codes < 0] = np.broadcast_to(sizes, codes.shape)[codes < 0]
+        padded = sizes + 1
+        left, right = np.triu_indices(len(self.columns), k=1)
+        widths = padded[left] * padded[right]
+        offsets = np.concatenate([[0], np.cumsum(widths)[:-1]])
+        total = int(widths.sum())
+        dtype = np.int32 if total < np.iinfo(np.int32).max else np.int64
+        codes = codes.astype(dtype)
+        offsets_c = offsets.astype(dtype)
+        stride = padded[right].astype(dtype)
+
+        counts = np.zeros(total, dtype=np.int64)
+        chunk = max(1, MAX_CELLS_PER_CHUNK // len(left))
+        for start in range(0, len(codes), chunk):
+            block = codes[start : start + chunk]
+            combined = block[:, left] * stride
+            combined += block[:, right]
+            combined += offsets_c
+            counts += np.bincount(combined.ravel(), minlength=total)
+
+        for pos, pair in enumerate(self.pairs):
+            shape = (int(padded[left[pos]]), int(padded[right[pos]]))
+            table = counts[offsets[pos] : offsets[pos] + widths[pos]].reshape(shape)[:-1, :-1]
+            previous = self.tables.get(pair)
+            if previous is not None:
+                # Categories only grow, so older tables are zero-padded to the new shape.
+                table = table.copy()
+                table[: previous.shape[0], : previous.shape[1]] += previous
+            self.tables[pair] = table
+
+    def table(self, a: str, b: str) -> pd.DataFrame:
+        return pd.DataFrame(self.tables[(a, b)], index=self.categories[a], columns=self.categories[b])
+
+    def results(self) -> pd.DataFrame:
+        rows = [
+            {"var_a": a, "var_b": b, **chi_square_stats(self.tables[(a, b)])}
+            for a, b in self.pairs
+            if (a, b) in self.tables
+        ]
+        return pd.DataFrame(rows, columns=["var_a", "var_b", "chi2", "p_value", "dof", "n", "cramers_v"])
+
+
+def chi_square_stats(table: np.ndarray) -> dict[str, float | int]:
+    """Chi-square test of independence matching scipy's chi2_contingency (Yates correction when dof == 1)."""
+    observed = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0].astype("float64")
+    n = int(observed.sum())
+    if observed.shape[0] < 2 or observed.shape[1] < 2:
+        return {"chi2": np.nan, "p_value": np.nan, "dof": np.nan, "n": n, "cramers_v": np.nan}
+
+    expected = np.outer(observed.sum(axis=1), observed.sum(axis=0)) / n
+    dof = (observed.shape[0] - 1) * (observed.shape[1] - 1)
+    raw_chi2 = float(((observed - expected) ** 2 / expected).sum())
+    stat = raw_chi2
+    if dof == 1:
+        diff = expected - observed
+        corrected = observed + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+        stat = float(((corrected - expected) ** 2 / expected).sum())
+    cramers_v = float(np.sqrt(raw_chi2 / (n * (min(observed.shape) - 1))))
+    return {"chi2": stat, "p_value": float(chi2_dist.sf(stat, dof)), "dof": dof, "n": n, "cramers_v": cramers_v}
+
+
+def association_results(df: pd.DataFrame, columns: Sequence[str] = QUESTION_COLUMNS) -> pd.DataFrame:
+    accumulator = ContingencyAccumulator([col for col in columns if col in df.columns])
+    accumulator.update(df)
+    return accumulator.results()
+
+
+def association_matrix(results: pd.DataFrame, value: str = "cramers_v") -> pd.DataFrame:
+    columns = list(dict.fromkeys(results["var_a"].tolist() + results["var_b"].tolist()))
+    matrix = pd.DataFrame(np.nan, index=columns, columns=columns)
+    for row in results.itertuples(index=False):
+        matrix.loc[row.var_a, row.var_b] = getattr(row, value)
+        matrix.loc[row.var_b, row.var_a] = getattr(row, value)
+    return matrix
+
+
+def write_associations(results: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    results.to_parquet(path, index=False)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.associations import chi_square_stats
+from src.data.artifacts import atomic_write
+from src.data.cube import cube_anxiety_table, cube_crosstab
+
+
+METRICS_VERSION = 1
+# Headline shares: answer column and the answers counted. The base is every response that
+# answered the question, so a skipped question does not dilute the share.
+KPI_DEFINITIONS = {
+    "negative_impact": ("q3_impact", ["Negativa"]),
+    "positive_impact": ("q3_impact", ["Positiva"]),
+    "problems": ("q4_problems", ["Si"]),
+    "wellbeing_ok": ("q15_wellbeing_final", ["Si"]),
+    "low_wellbeing": ("q15_wellbeing_final", ["No", "Tal vez"]),
+}
+CHI_SQUARE_TESTS = [
+    ("q3_impact", "q15_wellbeing_final"),
+    ("q4_problems", "q15_wellbeing_final"),
+    ("q4_problems", "anxiety_high"),
+]
+ALPHA = 0.05
+
+
+ANSWER_COLUMNS = list(dict.fromkeys(col for col, _ in KPI_DEFINITIONS.values()))
+
+
+def share(count: int, base: int) -> float | None:
+    return round(count / base * 100, 2) if base else None
+
+
+def finite(value: float | int) -> float | int | None:
+    # JSON has no NaN; undefined statistics (degenerate tables) are stored as null.
+    return None if isinstance(value, float) and math.isnan(value) else value
+
+
+def cell_counts(cube: pd.DataFrame) -> pd.DataFrame:
+    """Per-cell weights whose column sums are every count in the metrics document."""
+    n = cube["n"]
+    counts = {"responses": n, "with_timestamp": n.where(cube["day"].notna(), 0)}
+    for col in ANSWER_COLUMNS:
+        counts[f"answered:{col}"] = n.where(cube[col].notna(), 0)
+    for name, (col, values) in KPI_DEFINITIONS.items():
+        counts[f"count:{name}"] = n.where(cube[col].isin(values), 0)
+    # Missing anxiety scores count as not high, as in the cube and the dashboard.
+    counts["count:anxiety_high"] = cube["anxiety_high"]
+    return pd.DataFrame(counts)
+
+
+def metrics_document(counts: pd.Series, tables: dict[str, np.ndarray]) -> dict:
+    """Assemble the metrics document from summed `cell_counts` and one contingency table per test."""
+    responses = int(counts["responses"])
+    kpis: dict[str, dict] = {}
+    for name, (col, values) in KPI_DEFINITIONS.items():
+        count, base = int(counts[f"count:{name}"]), int(counts[f"answered:{col}"])
+        kpis[name] = {"column": col, "values": values, "count": count, "base": base, "value": share(count, base)}
+    anxious = int(counts["count:anxiety_high"])
+    kpis["anxiety_high"] = {
+        "column": "q14_anxiety_score",
+        "values": ["score >= 3"],
+        "count": anxious,
+        "base": responses,
+        "value": share(anxious, responses),
+    }
+
+    tests = []
+    for test, table in tables.items():
+        stats = {key: finite(value) for key, value in chi_square_stats(table).items()}
+        p_value = stats["p_value"]
+        tests.append({"test": test, **stats, "significant": p_value is not None and p_value < ALPHA})
+
+    return {
+        "version": METRICS_VERSION,
+        "rows": {
+            "responses": responses,
+            "with_timestamp": int(counts["with_timestamp"]),
+            "answered": {col: int(counts[f"answered:{col}"]) for col in ANSWER_COLUMNS},
+        },
+        "kpis": kpis,
+        "alpha": ALPHA,
+        "tests": tests,
+    }
+
+
+def build_metrics(cube: pd.DataFrame) -> dict:
+    """Headline KPIs, chi-square tests and row counts for the full dataset, computed from the cube."""
+    tables = {}
+    for a, b in CHI_SQUARE_TESTS:
+        table = cube_anxiety_table(cube, a) if b == "anxiety_high" else cube_crosstab(cube, a, b)
+        tables[f"{a} vs {b}"] = table.to_numpy()
+    return metrics_document(cell_counts(cube).sum(), tables)
+
+
+def segment_tables(cube: pd.DataFrame, keys: list[pd.Series], a: str, b: str) -> dict[tuple, np.ndarray]:
+    """Contingency table of one test for every segment, from a single groupby over the cube cells."""
+    sub = cube[cube[a].notna()] if b == "anxiety_high" else cube[cube[a].notna() & cube[b].notna()]
+    sub_keys = [key.loc[sub.index] for key in keys]
+    if b == "anxiety_high":
+        grouped = sub.groupby(sub_keys + [sub[a]], observed=True)[["n", "anxiety_high"]].sum()
+        cells = pd.DataFrame({"High": grouped["anxiety_high"], "Not high": grouped["n"] - grouped["anxiety_high"]})
+        cells = cells.stack()
+    else:
+        cells = sub.groupby(sub_keys + [sub[a], sub[b]], observed=True)["n"].sum()
+    levels = list(range(len(keys)))
+    tables = {}
+    for segment, part in cells.groupby(level=levels if len(levels) > 1 else 0, sort=False):
+        segment = segment if isinstance(segment, tuple) else (segment,)
+        tables[segment] = part.droplevel(levels).unstack(fill_value=0).to_numpy()
+    return tables
+
+
+def build_segment_metrics(cube: pd.DataFrame, keys: list[pd.Series]) -> dict[tuple, dict]:
+    """Metrics document per segment (combination of `keys` values, aligned to the cube cells).
+
+    All counts come from one groupby of the per-cell weights, and each test's tables from one
+    more groupby, instead of re-aggregating the cube once per segment.
+    """
+    counts = cell_counts(cube).groupby(keys, sort=True).sum()
+    tables = {f"{a} vs {b}": segment_tables(cube, keys, a, b) for a, b in CHI_SQUARE_TESTS}
+    empty = np.zeros((0, 0), dtype="int64")
+    metrics = {}
+    for segment, row in counts.iterrows():
+        segment = segment if isinstance(segment, tuple) else (segment,)
+        by_test = {test: by_segment.get(segment, empty) for test, by_segment in tables.items()}
+        metrics[segment] = metrics_document(row, by_test)
+    return metrics
+
+
+def write_metrics(metrics: dict, path: Path) -> None:
+    atomic_write(path, lambda tmp: tmp.write_text(json.dumps(metrics, indent=2) + "\n", encoding="utf-8"))
+
+
+def read_metrics(path: Path) -> dict | None:
+    try:
+        metrics = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return metrics if metrics.get("version") == METRICS_VERSION else None
+
+
+def kpi_values(metrics: dict) -> dict[str, float | int]:
+    """Flat name -> value mapping (plus `responses`) for formatting catalog strings; undefined shares are NaN."""
+    values: dict[str, float | int] = {
+        name: float("nan") if kpi["value"] is None else kpi["value"] for name, kpi in metrics["kpis"].items()
+    }
+    values["responses"] = metrics["rows"]["responses"]
+    return values
+
+
+def template_values(metrics: dict) -> dict[str, object]:
+    """Fields for `str.format` report templates: the `kpi_values` names plus `tests[<test>][<stat>]`."""
+    return {**kpi_values(metrics), "tests": {test["test"]: test for test in metrics["tests"]}}
+
+
+def significant_tests(metrics: dict) -> list[dict]:
+    return [test for test in metrics["tests"] if test["significant"]]
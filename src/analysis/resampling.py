@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing as mp
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+DEFAULT_RESAMPLES = 10_000
+DEFAULT_SEED = 2021
+# Resamples drawn per vectorized call; each batch gets its own child seed, so results do not
+# depend on the number of workers.
+RESAMPLE_BATCH = 2_000
+# Below this many resamples a call takes a few milliseconds serially (~20 ms for a permutation test
+# at 10k), less than handing the batches to worker processes, so it never leaves the caller.
+PARALLEL_MIN_RESAMPLES = 100_000
+CONFIDENCE = 0.95
+
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def pearson_chi2(tables: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """Pearson statistic of one table or a stack of tables (last two axes) against fixed expected counts."""
+    return ((tables - expected) ** 2 / expected).sum(axis=(-2, -1))
+
+
+def permuted_tables(row_totals: np.ndarray, col_totals: np.ndarray, size: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw `size` tables with the given margins, as if the column labels were randomly permuted.
+
+    Each cell is a hypergeometric draw conditioned on the cells already filled, so the cost
+    depends on the table shape and the number of resamples, not on the number of responses.
+    """
+    n_rows, n_cols = len(row_totals), len(col_totals)
+    tables = np.zeros((size, n_rows, n_cols), dtype=np.int64)
+    remaining_cols = np.broadcast_to(col_totals, (size, n_cols)).astype(np.int64)
+    for i in range(n_rows - 1):
+        to_draw = np.full(size, row_totals[i], dtype=np.int64)
+        pool = remaining_cols.sum(axis=1)
+        for j in range(n_cols - 1):
+            pool = pool - remaining_cols[:, j]
+            drawn = rng.hypergeometric(remaining_cols[:, j], pool, to_draw)
+            tables[:, i, j] = drawn
+            to_draw = to_draw - drawn
+        tables[:, i, -1] = to_draw
+        remaining_cols = remaining_cols - tables[:, i, :]
+    tables[:, -1, :] = remaining_cols
+    return tables
+
+
+def _permutation_batch(table: np.ndarray, size: int, seed: np.random.SeedSequence) -> int:
+    observed = np.asarray(table, dtype=np.int64)
+    row_totals, col_totals = observed.sum(axis=1), observed.sum(axis=0)
+    expected = np.outer(row_totals, col_totals) / observed.sum()
+    stat = pearson_chi2(observed, expected)
+    stats = pearson_chi2(permuted_tables(row_totals, col_totals, size, np.random.default_rng(seed)), expected)
+    # Relative tolerance so floating-point noise does not break ties with the observed table.
+    return int((stats >= stat * (1 - 1e-9)).sum())
+
+
+def _bootstrap_batch(count: int, n: int, size: int, seed: np.random.SeedSequence) -> np.ndarray:
+    # Resampling n responses with replacement and counting hits is a binomial draw.
+    return np.random.default_rng(seed).binomial(n, count / n, size=size) / n * 100
+
+
+def shared_pool(workers: int) -> ProcessPoolExecutor:
+    """Long-lived pool of `workers` processes, created on first use and reused by every later call.
+
+    Workers come from a forkserver (spawn where unavailable), never forked from the calling process,
+    which in the dashboard is a multithreaded server.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+            pool = _POOLS[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context(method))
+        return pool
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.shutdown(cancel_futures=True)
+        _POOLS.clear()
+
+
+def run_batches(
+    func: Callable[..., object],
+    args: tuple[object, ...],
+    n_resamples: int,
+    seed: int,
+    workers: int | None = None,
+) -> list[object]:
+    """Split `n_resamples` into fixed-size batches with spawned seeds and run them.
+
+    Calls of at least `PARALLEL_MIN_RESAMPLES` go to the shared process pool; smaller ones run serially.
+    """
+    sizes = [min(RESAMPLE_BATCH, n_resamples - start) for start in range(0, n_resamples, RESAMPLE_BATCH)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = min(workers or os.cpu_count() or 1, len(sizes))
+    if workers <= 1 or n_resamples < PARALLEL_MIN_RESAMPLES:
+        return [func(*args, size, child) for size, child in zip(sizes, seeds)]
+    pool = shared_pool(workers)
+    futures = [pool.submit(func, *args, size, child) for size, child in zip(sizes, seeds)]
+    return [future.result() for future in futures]
+
+
+def permutation_p_value(
+    table: np.ndarray,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    seed: int = DEFAULT_SEED,
+    workers: int | None = None,
+) -> float:
+    """Monte Carlo permutation p-value of the chi-square test of independence (margins held fixed)."""
+    observed = np.asarray(table, dtype=np.int64)
+    observed = observed[observed.sum(axis=1) > 0][:, observed.sum(axis=0) > 0]
+    if observed.shape[0] < 2 or observed.shape[1] < 2 or n_resamples < 1:
+        return float("nan")
+    hits = sum(run_batches(_permutation_batch, (observed,), n_resamples, seed, workers))
+    return (hits + 1) / (n_resamples + 1)
+
+
+def bootstrap_share_ci(
+    count: int,
+    n: int,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    seed: int = DEFAULT_SEED,
+    workers: int | None = None,
+    confidence: float = CONFIDENCE,
+) -> tuple[float, float]:
+    """Percentile bootstrap interval (in %) for the share `count / n`."""
+    if n <= 0 or n_resamples < 1:
+        return float("nan"), float("nan")
+    shares = np.concatenate(run_batches(_bootstrap_batch, (int(count), int(n)), n_resamples, seed, workers))
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(shares, [tail, 100 - tail])
+    return round(float(low), 2), round(float(high), 2)
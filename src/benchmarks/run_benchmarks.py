@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2_contingency
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.analysis.associations import association_results  # noqa: E402
+from src.analysis.resampling import bootstrap_share_ci, permutation_p_value  # noqa: E402
+from src.benchmarks.synthetic_survey import DEFAULT_SEED, generate_survey, write_survey  # noqa: E402
+from src.data.bitmap_index import RowIndex  # noqa: E402
+from src.data.clean_survey import load_and_clean, read_raw, safe_write  # noqa: E402
+from src.data.cube import build_cube, cube_count, cube_crosstab, cube_total  # noqa: E402
+from src.data.profiling import PROFILER  # noqa: E402
+
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_REPEAT = 3
+CLEAN_STAGES = ["read_raw", "rename", "normalize", "timestamp", "likert", "scores", "schema"]
+# A typical dashboard selection: one gender, all impacts, at-risk wellbeing, one week.
+SELECTION = {"gender": ("Mujer",), "q3_impact": (), "q15_wellbeing_final": ("No", "Tal vez")}
+WINDOW = (dt.date(2021, 5, 1), dt.date(2021, 5, 7))
+PERMUTATIONS = 10_000
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def summarize(times: list[float]) -> dict[str, float]:
+    return {"min_s": round(min(times), 4), "median_s": round(statistics.median(times), 4)}
+
+
+def synthetic_raw(n_rows: int, seed: int, raw_dir: Path, suffix: str = ".csv") -> Path:
+    # Generation is deterministic, so a file for the same size and seed is reused across runs.
+    path = raw_dir / f"synthetic_{n_rows}_{seed}{suffix}"
+    if not path.exists():
+        write_survey(generate_survey(n_rows, seed=seed), path)
+    return path
+
+
+def bench_pipeline(raw_file: Path, repeat: int, work_dir: Path) -> tuple[dict[str, dict[str, float]], pd.DataFrame]:
+    results: dict[str, dict[str, float]] = {}
+    results["read_raw_csv"] = measure(lambda: read_raw(raw_file), repeat)
+
+    # The profiler (timing only) splits load_and_clean into its stages without a second code path.
+    PROFILER.enable(trace_memory=False)
+    stage_times: dict[str, list[float]] = {stage: [] for stage in CLEAN_STAGES}
+    total_times = []
+    cleaned = pd.DataFrame()
+    for _ in range(repeat):
+        PROFILER.drain()
+        start = time.perf_counter()
+        cleaned = load_and_clean(raw_file)
+        total_times.append(time.perf_counter() - start)
+        for name, stats in PROFILER.drain().items():
+            stage_times.setdefault(name, []).append(stats.wall_s)
+    results["load_and_clean"] = summarize(total_times)
+    for name, times in stage_times.items():
+        if times:
+            results[f"clean.{name}"] = summarize(times)
+
+    outputs = (work_dir / "survey.parquet", work_dir / "survey.csv")
+    results["write_csv_parquet"] = measure(lambda: safe_write(cleaned, *outputs), repeat)
+    results["build_cube"] = measure(lambda: build_cube(cleaned), repeat)
+    results["association_results"] = measure(lambda: association_results(cleaned), repeat)
+    return results, cleaned
+
+
+def bench_dashboard(cleaned: pd.DataFrame, repeat: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    cube = build_cube(cleaned)
+    results["row_index_build"] = measure(lambda: RowIndex(cleaned), repeat)
+    results["cube_index_build"] = measure(lambda: RowIndex(cube, time_col="day"), repeat)
+
+    row_index = RowIndex(cleaned)
+    cube_index = RowIndex(cube, time_col="day")
+
+    def mask_filter() -> pd.DataFrame:
+        # Baseline: boolean masks over the rows, as the dashboard filtered before the cube and index.
+        dates = cleaned["timestamp"].dt.date
+        return cleaned[
+            cleaned["gender"].isin(SELECTION["gender"])
+            & cleaned["q15_wellbeing_final"].isin(SELECTION["q15_wellbeing_final"])
+            & (dates >= WINDOW[0])
+            & (dates <= WINDOW[1])
+        ]
+
+    results["filter_rows_mask"] = measure(mask_filter, repeat)
+    results["filter_rows_index"] = measure(lambda: cleaned.take(row_index.select(SELECTION, WINDOW)), repeat)
+    results["filter_cube_index"] = measure(lambda: cube.take(cube_index.select(SELECTION, WINDOW)), repeat)
+
+    results["chi_square_rows"] = measure(
+        lambda: chi2_contingency(pd.crosstab(cleaned["q3_impact"], cleaned["q15_wellbeing_final"])), repeat
+    )
+    results["chi_square_cube"] = measure(
+        lambda: chi2_contingency(cube_crosstab(cube, "q3_impact", "q15_wellbeing_final")), repeat
+    )
+    view = cube.take(cube_index.select(SELECTION))
+    table = cube_crosstab(view, "q4_problems", "q15_wellbeing_final").to_numpy()
+    results["permutation_p_value"] = measure(lambda: permutation_p_value(table, PERMUTATIONS, workers=1), repeat)
+    count, n_view = cube_count(view, "q3_impact", ["Negativa"]), cube_total(view)
+    results["bootstrap_share_ci"] = measure(lambda: bootstrap_share_ci(count, n_view, PERMUTATIONS, workers=1), repeat)
+    return results
+
+
+def git_revision() -> dict[str, object]:
+    def git(*args: str) -> str | None:
+        try:
+            completed = subprocess.run(
+                ["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True, timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return completed.stdout.strip()
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(status) if status is not None else None}
+
+
+def load_history(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if record.get("version") == RESULTS_VERSION:
+            records.append(record)
+    return records
+
+
+def find_baseline(history: list[dict], commit: str | None, baseline: str | None) -> dict | None:
+    """Latest recorded run of `baseline` (a commit prefix), or else the latest run of another commit."""
+    for record in reversed(history):
+        recorded = record.get("commit") or ""
+        if baseline is not None:
+            if recorded.startswith(baseline):
+                return record
+        elif recorded != commit:
+            return record
+    return None
+
+
+def format_results(record: dict, baseline: dict | None) -> str:
+    header = f"{'rows':>10}  {'benchmark':<28}{'min s':>10}{'median s':>10}"
+    if baseline is not None:
+        header += f"{'base min s':>12}{'ratio':>8}"
+    lines = [header]
+    for size, benches in record["results"].items():
+        base_benches = (baseline or {}).get("results", {}).get(size, {})
+        for name, stats in benches.items():
+            line = f"{size:>10}  {name:<28}{stats['min_s']:>10.4f}{stats['median_s']:>10.4f}"
+            base = base_benches.get(name)
+            if baseline is not None and base is not None and base["min_s"] > 0:
+                line += f"{base['min_s']:>12.4f}{stats['min_s'] / base['min_s']:>8.2f}"
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time pipeline stages and dashboard computations on synthetic data.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Synthetic response counts to benchmark.",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed repetitions per benchmark.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed of the synthetic generator.")
+    parser.add_argument(
+        "--xlsx-rows",
+        type=int,
+        default=0,
+        help="Also time reading a synthetic .xlsx export of this many rows (writing it is slow; 0 skips it).",
+    )
+    parser.add_argument(
+        "--raw-dir",
+        type=Path,
+        default=Path("data/benchmarks/raw"),
+        help="Directory of generated raw files, reused across runs.",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=Path("data/benchmarks/history.jsonl"),
+        help="JSON lines file every run is appended to.",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Commit (prefix) to compare against; defaults to the latest recorded run of another commit.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    raw_dir = args.raw_dir if args.raw_dir.is_absolute() else PROJECT_ROOT / args.raw_dir
+    history_path = args.history if args.history.is_absolute() else PROJECT_ROOT / args.history
+
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as work:
+        for n_rows in args.sizes:
+            print(f"Benchmarking {n_rows} rows...", flush=True)
+            raw_file = synthetic_raw(n_rows, args.seed, raw_dir)
+            pipeline, cleaned = bench_pipeline(raw_file, args.repeat, Path(work))
+            results[str(n_rows)] = {**pipeline, **bench_dashboard(cleaned, args.repeat)}
+        if args.xlsx_rows:
+            xlsx_file = synthetic_raw(args.xlsx_rows, args.seed, raw_dir, suffix=".xlsx")
+            results.setdefault(str(args.xlsx_rows), {})["read_raw_xlsx"] = measure(
+                lambda: read_raw(xlsx_file), args.repeat
+            )
+
+    record = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        **git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    history = load_history(history_path)
+    baseline = find_baseline(history, record["commit"], args.baseline)
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with history_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record) + "\n")
+
+    print(format_results(record, baseline))
+    if baseline is not None:
+        print(f"Baseline: {baseline.get('commit')} ({baseline.get('created')})")
+    print(f"History: {history_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.clean_survey import COLUMN_RENAME, LIKERT_COLUMNS, RAW_SHEET  # noqa: E402
+
+
+DEFAULT_SEED = 2021
+START = pd.Timestamp("2021-04-29 22:00:00")
+# The real export spans about two weeks of responses.
+DEFAULT_DAYS = 14
+# Share of answers rewritten into one of the dirty spellings the cleaner has to absorb.
+DEFAULT_DIRTY_RATE = 0.1
+
+# Answer catalogs with the frequencies of the 2021 export (missing answers as None). Ordered columns
+# list their answers from best to worst so a shared latent "distress" factor can correlate them.
+CATALOGS: dict[str, dict[str | None, int]] = {
+    "gender": {"Hombre": 92, "Mujer": 85, "Otro": 1},
+    "q1_current_state": {"Bien": 107, "Ni bien ni mal.": 64, "Mal": 3, "Prefiero no responder.": 4},
+    "q2_emotional_state": {"Excelente": 20, "Muy bien": 40, "Regular": 83, "No tan mal": 24, "Mal": 11},
+    "q3_impact": {"Positiva": 85, "Negativa.": 92, None: 1},
+    "q4_problems": {"No": 44, "Prefiero no decir.": 14, "Sí": 119, None: 1},
+    "q5_help_seek": {"Sí": 59, "Lo he pensado.": 32, "No": 57, None: 30},
+    "q6_pre_pandemic_state": {"Muy bien": 71, "Bien": 49, "Normal": 40, "No tan mal": 12, "Mal.": 6},
+    "q7_learned_new_skill": {"Sí": 96, "No": 81, None: 1},
+    "q9_future_normality": {"Sí": 69, "Tal vez": 70, "No": 39},
+    "q10_stress": {"Nunca": 16, "Casi nunca": 33, "De vez en cuando": 94, "Casi siempre": 24, "Siempre.": 7},
+    "q11_optimism": {"Siempre.": 18, "Casi siempre": 36, "De vez en cuando": 85, "Casi nunca": 32, "Nunca": 2},
+    "q12_control": {
+        "Siempre.": 11,
+        "Casi siempre": 29,
+        "De vez en cuando": 72,
+        "Casi nunca": 43,
+        "Nunca": 14,
+        "Prefiero no responder.": 3,
+    },
+    "q13_protocols": {
+        "Siempre.": 84,
+        "Casi siempre": 38,
+        "De vez en cuando": 37,
+        "Casi nunca": 5,
+        "Prefiero no responder.": 5,
+    },
+    "q14_anxiety": {"Nunca": 48, "Casi nunca": 43, "De vez en cuando": 48, "Casi siempre": 20, "Siempre.": 11},
+    "q15_wellbeing_final": {"Sí": 101, "Tal vez": 55, "No": 18, "Prefiero no responder.": 4},
+}
+# Loading of each ordered column on the latent factor; 0 keeps a column independent.
+LOADINGS = {
+    "q1_current_state": 0.5,
+    "q2_emotional_state": 0.5,
+    "q3_impact": 0.4,
+    "q4_problems": 0.5,
+    "q6_pre_pandemic_state": 0.3,
+    "q10_stress": 0.5,
+    "q11_optimism": 0.4,
+    "q12_control": 0.4,
+    "q14_anxiety": 0.6,
+    "q15_wellbeing_final": 0.6,
+}
+LEARNED_TEXT = ["Cocinar", "Manualidades ", "Ingles", "A tocar guitarra", "Programacion", "Dibujo y pintura"]
+LEARNED_SHARE = 0.57
+LIKERT_RAW = ["Nunca", "Casi nunca", "De vez en cuando", "Casi siempre", "Siempre."]
+DIRTY_SPELLINGS = {
+    "Sí": ["Si", " Sí", "Sí "],
+    "Negativa.": ["Negativa", "Negativa.  "],
+    "Positiva": ["Positiva.", " Positiva"],
+    "Siempre.": ["Siempre", "siempre."],
+    "Mal.": ["Mal", "Mal. "],
+}
+
+
+def raw_headers() -> dict[str, str]:
+    # The last spelling of each target in COLUMN_RENAME is the one the real export uses.
+    return {target: header for header, target in COLUMN_RENAME.items()}
+
+
+def ordered_answers(
+    catalog: dict[str | None, int],
+    latent: np.ndarray,
+    loading: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Sample answers with the catalog frequencies; with a loading, rank them along `latent` (Gaussian copula)."""
+    answers = np.array(list(catalog), dtype="object")
+    weights = np.array(list(catalog.values()), dtype=float)
+    cumulative = np.cumsum(weights / weights.sum())
+    noise = rng.standard_normal(len(latent))
+    uniform = ndtr(loading * latent + np.sqrt(1 - loading**2) * noise)
+    return answers[np.minimum(np.searchsorted(cumulative, uniform, side="right"), len(answers) - 1)]
+
+
+def dirty(values: np.ndarray, rate: float, rng: np.random.Generator, likert: bool = False) -> np.ndarray:
+    """Rewrite a share of answers into spellings seen in raw exports (accents, periods, spaces, combined cells)."""
+    values = values.copy()
+    hit = rng.random(len(values)) < rate
+    for clean, variants in DIRTY_SPELLINGS.items():
+        mask = hit & (values == clean)
+        if mask.any():
+            values[mask] = np.array(variants, dtype="object")[rng.integers(0, len(variants), mask.sum())]
+    if likert:
+        # Some respondents tick two boxes; the export joins them with ", " and the first valid one wins.
+        combined = hit & (rng.random(len(values)) < 0.3) & pd.Series(values).isin(LIKERT_RAW).to_numpy()
+        if combined.any():
+            second = np.array(LIKERT_RAW, dtype="object")[rng.integers(0, len(LIKERT_RAW), combined.sum())]
+            values[combined] = values[combined] + ", " + second
+    return values
+
+
+def generate_survey(
+    n_rows: int,
+    seed: int = DEFAULT_SEED,
+    dirty_rate: float = DEFAULT_DIRTY_RATE,
+    days: int = DEFAULT_DAYS,
+) -> pd.DataFrame:
+    """Synthetic raw export: real headers, 2021 answer frequencies, correlated answers and dirty spellings."""
+    rng = np.random.default_rng(seed)
+    headers = raw_headers()
+    latent = rng.standard_normal(n_rows)
+    offsets = np.sort(rng.random(n_rows)) * days * 86_400_000
+    columns: dict[str, object] = {
+        "timestamp_raw": START + pd.to_timedelta(offsets.astype(np.int64), unit="ms"),
+        "email": np.char.add(np.char.add("respondent", np.arange(n_rows).astype(str)), "@example.com"),
+    }
+    for target in headers:
+        if target in CATALOGS:
+            answers = ordered_answers(CATALOGS[target], latent, LOADINGS.get(target, 0.0), rng)
+            columns[target] = dirty(answers, dirty_rate, rng, likert=target in LIKERT_COLUMNS)
+    columns["name"] = np.char.add("Respondent ", np.arange(n_rows).astype(str))
+    learned = np.array(LEARNED_TEXT, dtype="object")[rng.integers(0, len(LEARNED_TEXT), n_rows)]
+    columns["q8_learned_text"] = np.where(rng.random(n_rows) < LEARNED_SHARE, None, learned)
+
+    return pd.DataFrame({header: columns[target] for target, header in headers.items()})
+
+
+def write_survey(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, sheet_name=RAW_SHEET, index=False)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic raw survey export for benchmarks.")
+    parser.add_argument("output", type=Path, help="Target .csv or .xlsx file (sheet BD).")
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of responses.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed.")
+    parser.add_argument(
+        "--dirty-rate",
+        type=float,
+        default=DEFAULT_DIRTY_RATE,
+        help="Share of answers written with a dirty spelling (accent, trailing period, spaces, combined Likert cells).",
+    )
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Days spanned by the timestamps.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    df = generate_survey(args.rows, seed=args.seed, dirty_rate=args.dirty_rate, days=args.days)
+    write_survey(df, args.output)
+    print(f"Rows: {len(df)}")
+    print(f"Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.data.raw_cache import file_fingerprint
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+MANIFEST_VERSION = 1
+
+
+def temp_path(path: Path) -> Path:
+    # Same directory as the target, so the final rename never crosses filesystems.
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def fsync_dir(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def publish(tmp: Path, path: Path) -> None:
+    """Flush a finished temp file to disk and rename it over `path` in one atomic step."""
+    with tmp.open("r+b") as handle:
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
+    fsync_dir(path.parent)
+
+
+def atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    """Run `write` against a temp file next to `path` and publish it; readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = temp_path(path)
+    try:
+        write(tmp)
+        publish(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def replaceable_dir(path: Path, marker: str) -> bool:
+    """True when a directory swap may replace `path`: it is absent, empty, or holds `marker`.
+
+    `marker` is the file every writer of that artifact leaves in it, so any other directory was not
+    created by us and is never moved aside or deleted.
+    """
+    if not path.exists():
+        return True
+    if not path.is_dir():
+        return False
+    return (path / marker).is_file() or not any(path.iterdir())
+
+
+def atomic_write_dir(path: Path, write: Callable[[Path], None], marker: str) -> None:
+    """Build a directory artifact next to `path` and swap it in with renames.
+
+    `write` must leave `marker` in the directory it builds; an existing `path` without it raises
+    FileExistsError instead of being replaced. There is a short window between moving the old
+    directory aside and renaming the new one into place in which `path` does not exist; readers
+    treat a missing dataset as "not built".
+    """
+    if not replaceable_dir(path, marker):
+        raise FileExistsError(f"{path} exists and has no {marker}; refusing to replace a directory we did not write.")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = temp_path(path)
+    old = path.with_name(f".{path.name}.{os.getpid()}.old")
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        write(tmp)
+        if path.exists():
+            os.replace(path, old)
+        os.replace(tmp, path)
+        fsync_dir(path.parent)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if old.exists() and not path.exists():
+            os.replace(old, path)
+        raise
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def link_artifact(source: Path, target: Path) -> None:
+    """Publish `target` as a hard link to `source` (a copy where links are unsupported), atomically.
+
+    Safe because every writer replaces files instead of modifying them in place, so a later write to
+    either path gets a new inode and never changes the other.
+    """
+    if target.exists() and os.path.samefile(source, target):
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = temp_path(target)
+    tmp.unlink(missing_ok=True)
+    try:
+        try:
+            os.link(source, tmp)
+        except OSError:
+            shutil.copyfile(source, tmp)
+        publish(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def pipeline_lock(lock_path: Path) -> Iterator[None]:
+    """Exclusive advisory lock so concurrent pipeline runs (e.g. several compose services) serialize."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def artifact_rows(path: Path) -> int | None:
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_metadata(path).num_rows
+    if path.suffix == ".csv":
+        with path.open("rb") as handle:
+            return max(sum(1 for _ in handle) - 1, 0)
+    return None
+
+
+def read_manifest(path: Path) -> dict | None:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def dataset_is_current(manifest: dict | None, key: str) -> bool:
+    """True when directory artifact `key` was built from the version of its source the manifest lists now."""
+    entries = manifest["artifacts"] if manifest is not None else {}
+    entry = entries.get(key)
+    if entry is None or "source" not in entry:
+        return False
+    source = entries.get(entry["source"])
+    return source is not None and source["sha256"] == entry["source_sha256"]
+
+
+def publish_manifest(
+    manifest_path: Path,
+    artifacts: dict[str, Path],
+    datasets: dict[str, dict] | None = None,
+) -> dict:
+    """Record row count, size and SHA-256 of each published artifact under a new generation number.
+
+    `datasets` are directory artifacts rebuilt in this run, each {"rows": ..., "source": artifact key};
+    they are stamped with the source's SHA-256 and the new generation, so a later run that replaces the
+    source without rebuilding the dataset leaves it detectably stale.
+    """
+    previous = read_manifest(manifest_path) or {}
+    generation = int(previous.get("generation", 0)) + 1
+    entries = dict(previous.get("artifacts", {}))
+    for key, path in artifacts.items():
+        if not path.exists():
+            entries.pop(key, None)
+            continue
+        entries[key] = {
+            "rows": artifact_rows(path),
+            "bytes": path.stat().st_size,
+            "sha256": file_fingerprint(path),
+        }
+    for key, entry in (datasets or {}).items():
+        entries[key] = {**entry, "source_sha256": entries[entry["source"]]["sha256"], "generation": generation}
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generation": generation,
+        "artifacts": entries,
+    }
+    atomic_write(
+        manifest_path,
+        lambda tmp: tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"),
+    )
+    return manifest
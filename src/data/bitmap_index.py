@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+FILTER_COLUMNS = ["gender", "q3_impact", "q15_wellbeing_final"]
+
+
+class RowIndex:
+    """Packed per-value bitmaps for categorical filters plus a sorted timestamp index.
+
+    A selection resolves to row positions with bitwise OR (values of one column) and AND
+    (across columns) over packed bitsets, and a binary search for the date window, so no
+    boolean Series or intermediate frame is built per filter.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: Sequence[str] = FILTER_COLUMNS, time_col: str = "timestamp") -> None:
+        self.n_rows = len(df)
+        self.bitmaps: dict[str, dict[object, np.ndarray]] = {}
+        for col in columns:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+            self.bitmaps[col] = {
+                value: np.packbits(codes == code) for code, value in enumerate(uniques.tolist())
+            }
+
+        self.order: np.ndarray | None = None
+        self.sorted_ts: np.ndarray | None = None
+        if time_col in df.columns:
+            ts = df[time_col].to_numpy(dtype="datetime64[ns]")
+            valid = np.flatnonzero(~np.isnat(ts))
+            self.order = valid[np.argsort(ts[valid], kind="stable")]
+            self.sorted_ts = ts[self.order]
+
+    def _full(self) -> np.ndarray:
+        return np.packbits(np.ones(self.n_rows, dtype=bool))
+
+    def _empty(self) -> np.ndarray:
+        return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+
+    def column_bits(self, col: str, values: Sequence[object]) -> np.ndarray:
+        bitmaps = self.bitmaps[col]
+        bits = self._empty()
+        for value in values:
+            if value in bitmaps:
+                np.bitwise_or(bits, bitmaps[value], out=bits)
+        return bits
+
+    def date_bits(self, date_window: tuple[dt.date, dt.date]) -> np.ndarray:
+        start_d, end_d = date_window
+        # Calendar-day bounds: [start 00:00, end + 1 day 00:00).
+        lo = np.searchsorted(self.sorted_ts, np.datetime64(pd.Timestamp(start_d), "ns"), side="left")
+        hi = np.searchsorted(
+            self.sorted_ts, np.datetime64(pd.Timestamp(end_d) + pd.Timedelta(days=1), "ns"), side="left"
+        )
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.order[lo:hi]] = True
+        return np.packbits(mask)
+
+    def select(
+        self,
+        selections: Mapping[str, Sequence[object]],
+        date_window: tuple[dt.date, dt.date] | None = None,
+    ) -> np.ndarray:
+        """Return the sorted row positions matching every non-empty selection and the date window."""
+        bits = self._full()
+        for col, values in selections.items():
+            # Same semantics as the isin filters: an empty selection (or unknown column) does not filter.
+            if values and col in self.bitmaps:
+                np.bitwise_and(bits, self.column_bits(col, values), out=bits)
+        if date_window is not None and self.order is not None:
+            np.bitwise_and(bits, self.date_bits(date_window), out=bits)
+        return np.flatnonzero(np.unpackbits(bits, count=self.n_rows))
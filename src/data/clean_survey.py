@@ -0,0 +1,1053 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+if __package__ in (None, ""):
+    # Allow `python src/data/clean_survey.py` as well as `python -m src.data.clean_survey`.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analysis.associations import (
+    QUESTION_COLUMNS,
+    ContingencyAccumulator,
+    association_results,
+    write_associations,
+)
+from src.analysis.metrics import build_metrics, write_metrics
+from src.data.artifacts import (
+    atomic_write,
+    atomic_write_dir,
+    dataset_is_current,
+    link_artifact,
+    pipeline_lock,
+    publish,
+    publish_manifest,
+    read_manifest,
+    replaceable_dir,
+    temp_path,
+)
+from src.data.cube import build_cube, merge_cubes, read_cube, write_cube
+from src.data.headers import HeaderResolver
+from src.data.partitions import DATASET_MARKER, write_partitioned
+from src.data.profiling import PROFILER, enable_profiling, format_report, write_report
+from src.data.raw_cache import DEFAULT_MAX_BYTES, RawCache, file_fingerprint
+from src.data.schema import LIKERT_LEVELS, apply_schema, read_processed
+
+
+COLUMN_RENAME = {
+    "Marca temporal": "timestamp_raw",
+    "Direccion de correo electronico": "email",
+    "Direcci\u00f3n de correo electr\u00f3nico": "email",
+    "Eres... (selecciona uno)": "gender",
+    "Tu nombre": "name",
+    "1.-\u00bfC\u00f3mo estas en este momento?": "q1_current_state",
+    "2.-\u00bfC\u00f3mo te has sentido contigo mismo, en este confinamiento, hablando emocionalmente?": "q2_emotional_state",
+    "3.-\u00bfEsta pandemia ha tenido impacto de manera positiva o negativa hacia ti?": "q3_impact",
+    "4.-\u00bfHas tenido problemas sociales, emocionales, economicos o psicologicos en esta pandemia?": "q4_problems",
+    "5.-Si la respuesta anterior fue si, \u00bfHas platicado con alguien o has buscado ayuda?": "q5_help_seek",
+    "6.-\u00bfAntes del confinamiento por el COVID-19, como te sentias emocionalmente?Bien": "q6_pre_pandemic_state",
+    "6.-\u00bfAntes del confinamiento por el COVID-19, como te sent\u00edas emocionalmente?Bien": "q6_pre_pandemic_state",
+    "7.-\u00bfHas aprendido algo nuevo en este confinamiento? (Ya sea un nuevo idioma, artes marciales, manualidades, etc)": "q7_learned_new_skill",
+    "8.-Si tu respuesta a la pregunta anterior fue si, comparte que fue lo que has aprendido, pueden ser 1 o varias.": "q8_learned_text",
+    "9.-\u00bfHas pensado que las cosas volveran a ser como antes o se mantendra la nueva normalidad?": "q9_future_normality",
+    "10.-\u00bfC\u00f3mo te sientes al final de todo? [Me he sentido nervioso o estresado por la epidemia]": "q10_stress",
+    "11.-\u00bfC\u00f3mo te sientes al final de todo? [He sentido que las cosas van bien (optimista) con]": "q11_optimism",
+    "12.-\u00bfC\u00f3mo te sientes al final de todo? [He sentido que tengo todo controlado en relaci\u00f3n con la pandemia]": "q12_control",
+    "13.-\u00bfC\u00f3mo te sientes al final de todo? [Sigues los protocolos que el sistema de salud ha recomendado.]": "q13_protocols",
+    "14.-\u00bfC\u00f3mo te sientes al final de todo? [Sufres ansiedad.]": "q14_anxiety",
+    "15.-Por ultimo, siendo honestos, estas bien? ": "q15_wellbeing_final",
+}
+
+HEADER_RESOLVER = HeaderResolver(COLUMN_RENAME)
+
+
+PII_COLUMNS = ["email", "name"]
+RAW_SHEET = "BD"
+DEFAULT_BATCH_SIZE = 50_000
+CUBE_MERGE_EVERY = 16
+STATE_VERSION = 2
+RAW_SUFFIXES = (".xlsx", ".csv")
+SOURCE_COLUMN = "source_file"
+LOCK_NAME = ".pipeline.lock"
+SHEET_COLUMN = "source_sheet"
+# A sheet is treated as survey data when its header row resolves to at least this many known columns.
+MIN_SURVEY_HEADERS = 10
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def resolve_project_path(path: Path) -> Path:
+    return path if path.is_absolute() else (PROJECT_ROOT / path)
+
+
+def rel_or_abs(path: Path) -> str:
+    try:
+        return str(path.relative_to(PROJECT_ROOT))
+    except ValueError:
+        return str(path)
+
+
+BASIC_REPLACEMENTS = {
+    "Si": "Si",
+    "S\u00ed": "Si",
+    "Negativa.": "Negativa",
+    "Positiva.": "Positiva",
+    "Siempre.": "Siempre",
+    "Mal.": "Mal",
+}
+
+
+LIKERT_CANONICAL = {level.lower(): level for level in LIKERT_LEVELS}
+LIKERT_COLUMNS = ["q10_stress", "q11_optimism", "q12_control", "q13_protocols", "q14_anxiety"]
+
+
+def normalize_text(value: object) -> object:
+    if pd.isna(value):
+        return pd.NA
+    text = str(value).strip()
+    text = re.sub(r"\s+", " ", text)
+    return text if text else pd.NA
+
+
+def normalize_basic(value: object) -> object:
+    text = normalize_text(value)
+    if pd.isna(text):
+        return pd.NA
+    return BASIC_REPLACEMENTS.get(text, text)
+
+
+def normalize_likert(value: object) -> object:
+    text = normalize_basic(value)
+    if pd.isna(text):
+        return pd.NA
+
+    raw_tokens = [token.strip(" .") for token in str(text).split(",")]
+    for token in raw_tokens:
+        key = token.lower()
+        if key in LIKERT_CANONICAL:
+            return LIKERT_CANONICAL[key]
+    return text
+
+
+# Vectorized counterparts of the per-cell functions above. They produce the same
+# values (object dtype, missing as pd.NA) without a Python call per cell. Answers repeat
+# heavily, so each column is factorized and only its distinct values are normalized; the
+# results are interned so equal answers share one string object across columns and batches.
+# Factorizing merges equal non-string keys (1, 1.0 and True; 0.0 and -0.0) whose text differs,
+# so columns holding anything but strings take the per-cell path.
+FACTORIZABLE_DTYPES = {"string", "empty"}
+
+
+def map_uniques(
+    series: pd.Series,
+    normalize: Callable[[pd.Series], pd.Series],
+    normalize_value: Callable[[object], object],
+) -> pd.Series:
+    if pd.api.types.infer_dtype(series, skipna=True) not in FACTORIZABLE_DTYPES:
+        return series.map(normalize_value).astype("object")
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return pd.Series(pd.NA, index=series.index, dtype="object")
+    normalized = normalize(pd.Series(uniques, dtype=uniques.dtype))
+    lookup = np.array(
+        [sys.intern(value) if isinstance(value, str) else value for value in normalized.tolist()] + [pd.NA],
+        dtype="object",
+    )
+    # Code -1 (missing) indexes the trailing pd.NA slot.
+    return pd.Series(lookup[codes], index=series.index, dtype="object")
+
+
+def _normalize_text_values(values: pd.Series) -> pd.Series:
+    text = values.astype(str).str.strip().str.replace(r"\s+", " ", regex=True)
+    return text.where(text != "", pd.NA)
+
+
+def _normalize_basic_values(values: pd.Series) -> pd.Series:
+    return _normalize_text_values(values).replace(BASIC_REPLACEMENTS)
+
+
+def _normalize_likert_values(values: pd.Series) -> pd.Series:
+    text = _normalize_basic_values(values).reset_index(drop=True)
+    present = text.notna()
+    if not present.any():
+        return text
+
+    tokens = text[present].str.split(",").explode().str.strip(" .").str.lower().map(LIKERT_CANONICAL)
+    # groupby().first() skips missing values, so this keeps the first valid option per cell.
+    first_valid = tokens.groupby(level=0, sort=False).first().reindex(text.index)
+    return first_valid.where(first_valid.notna(), text)
+
+
+def normalize_text_series(series: pd.Series) -> pd.Series:
+    return map_uniques(series, _normalize_text_values, normalize_text)
+
+
+def normalize_basic_series(series: pd.Series) -> pd.Series:
+    return map_uniques(series, _normalize_basic_values, normalize_basic)
+
+
+def normalize_likert_series(series: pd.Series) -> pd.Series:
+    return map_uniques(series, _normalize_likert_values, normalize_likert)
+
+
+def cast_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+    if "timestamp_raw" not in df.columns:
+        return df
+
+    series = df["timestamp_raw"]
+    # Google Forms exports may already be datetime; Excel exports may be serial numbers.
+    if pd.api.types.is_numeric_dtype(series):
+        df["timestamp"] = pd.to_datetime(series, errors="coerce", origin="1899-12-30", unit="D")
+    else:
+        df["timestamp"] = pd.to_datetime(series, errors="coerce")
+    return df
+
+
+def build_scores(df: pd.DataFrame) -> pd.DataFrame:
+    likert_score = {
+        "Nunca": 0,
+        "Casi nunca": 1,
+        "De vez en cuando": 2,
+        "Casi siempre": 3,
+        "Siempre": 4,
+    }
+    for col in LIKERT_COLUMNS:
+        if col in df.columns:
+            df[f"{col}_score"] = df[col].map(likert_score)
+
+    wellbeing_score = {"No": 0, "Tal vez": 1, "Si": 2}
+    if "q15_wellbeing_final" in df.columns:
+        df["q15_wellbeing_score"] = df["q15_wellbeing_final"].map(wellbeing_score)
+
+    return df
+
+
+def read_raw(raw_file: Path, sheet_name: str = RAW_SHEET, raw_cache: RawCache | None = None) -> pd.DataFrame:
+    if raw_file.suffix.lower() == ".csv":
+        return pd.read_csv(raw_file)
+    if raw_cache is not None:
+        return raw_cache.read(raw_file, sheet_name, lambda: pd.read_excel(raw_file, sheet_name=sheet_name))
+    return pd.read_excel(raw_file, sheet_name=sheet_name)
+
+
+def iter_raw_batches(
+    raw_file: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    sheet_name: str = RAW_SHEET,
+    raw_cache: RawCache | None = None,
+) -> Iterator[pd.DataFrame]:
+    if raw_file.suffix.lower() == ".csv":
+        yield from pd.read_csv(raw_file, chunksize=batch_size)
+        return
+
+    # A converted snapshot streams in Parquet row batches; otherwise fall back to openpyxl.
+    cached = raw_cache.iter_batches(raw_file, sheet_name, batch_size) if raw_cache is not None else None
+    if cached is not None:
+        yield from cached
+        return
+
+    from openpyxl import load_workbook
+
+    # Read-only mode streams rows from the sheet XML instead of building the whole workbook.
+    workbook = load_workbook(raw_file, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [f"Unnamed: {idx}" if name is None else name for idx, name in enumerate(header)]
+        batch: list[tuple] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield pd.DataFrame(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Robust rename: canonical lookup absorbs accent and spacing variants, fuzzy matching near-miss wording.
+    return df.rename(columns=HEADER_RESOLVER.rename_map(df.columns))
+
+
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    with PROFILER.stage("rename", len(df)):
+        df = df.dropna(how="all").copy()
+        df = rename_columns(df)
+
+    with PROFILER.stage("normalize", len(df)):
+        for col in df.columns:
+            if df[col].dtype == "object":
+                df[col] = normalize_basic_series(df[col])
+
+    with PROFILER.stage("timestamp", len(df)):
+        df = cast_timestamp(df)
+
+    with PROFILER.stage("likert", len(df)):
+        for col in LIKERT_COLUMNS:
+            if col in df.columns:
+                df[col] = normalize_likert_series(df[col])
+                df[col] = pd.Categorical(df[col], categories=LIKERT_LEVELS, ordered=True)
+
+        if "q3_impact" in df.columns:
+            df["q3_impact"] = df["q3_impact"].replace({"Positiva.": "Positiva", "Negativa.": "Negativa"})
+
+        if "q15_wellbeing_final" in df.columns:
+            df["q15_wellbeing_final"] = df["q15_wellbeing_final"].replace({"S\u00ed": "Si"})
+
+    with PROFILER.stage("scores", len(df)):
+        df = df.drop(columns=[col for col in PII_COLUMNS if col in df.columns], errors="ignore")
+        df = build_scores(df)
+
+    with PROFILER.stage("schema", len(df)):
+        return apply_schema(df)
+
+
+def load_and_clean(raw_file: Path, sheet_name: str = RAW_SHEET, raw_cache: RawCache | None = None) -> pd.DataFrame:
+    with PROFILER.stage("read_raw") as stage:
+        raw = read_raw(raw_file, sheet_name=sheet_name, raw_cache=raw_cache)
+        stage.rows = len(raw)
+    return clean_frame(raw)
+
+
+def collect_raw_files(pattern: str) -> list[Path]:
+    """Expand a directory (every .xlsx/.csv inside) or a glob pattern into a sorted list of raw files."""
+    path = resolve_project_path(Path(pattern))
+    if path.is_dir():
+        candidates = [p for p in path.iterdir() if p.is_file()]
+    else:
+        candidates = [Path(p) for p in glob.glob(str(path), recursive=True)]
+    # Skip Excel lock files ("~$...") left next to open workbooks.
+    return sorted(p for p in candidates if p.suffix.lower() in RAW_SUFFIXES and not p.name.startswith("~$"))
+
+
+def discover_sheets(raw_file: Path, min_headers: int = MIN_SURVEY_HEADERS) -> list[str]:
+    """Names of the workbook sheets whose header row matches the survey schema (CSV files have one)."""
+    if raw_file.suffix.lower() == ".csv":
+        return [RAW_SHEET]
+
+    from openpyxl import load_workbook
+
+    # Only the first row of each sheet is read.
+    workbook = load_workbook(raw_file, read_only=True, data_only=True)
+    try:
+        sheets = []
+        for worksheet in workbook.worksheets:
+            header = next(worksheet.iter_rows(max_row=1, values_only=True), ())
+            if len(HEADER_RESOLVER.rename_map([h for h in header if h is not None])) >= min_headers:
+                sheets.append(worksheet.title)
+        return sheets
+    finally:
+        workbook.close()
+
+
+def collect_sources(raw_files: list[Path], all_sheets: bool = False) -> list[tuple[Path, str]]:
+    if not all_sheets:
+        return [(path, RAW_SHEET) for path in raw_files]
+    return [(path, sheet) for path in raw_files for sheet in discover_sheets(path)]
+
+
+def clean_source(
+    raw_file: Path,
+    sheet_name: str = RAW_SHEET,
+    raw_cache: RawCache | None = None,
+    tag_sheet: bool = False,
+) -> pd.DataFrame:
+    df = load_and_clean(raw_file, sheet_name=sheet_name, raw_cache=raw_cache)
+    df[SOURCE_COLUMN] = raw_file.name
+    if tag_sheet:
+        df[SHEET_COLUMN] = sheet_name if raw_file.suffix.lower() != ".csv" else None
+    # Worker processes persist their own learned header matches.
+    HEADER_RESOLVER.save()
+    return df
+
+
+def profiled_clean_source(*args: object) -> tuple[pd.DataFrame, dict]:
+    # Worker processes have their own profiler; ship its stages back with the frame.
+    df = clean_source(*args)
+    return df, PROFILER.drain()
+
+
+def parallel_clean(
+    sources: list[tuple[Path, str]],
+    workers: int | None = None,
+    raw_cache: RawCache | None = None,
+    tag_sheet: bool = False,
+) -> pd.DataFrame:
+    """Clean each (raw file, sheet) source in its own worker process and merge them in source order."""
+    workers = min(workers or os.cpu_count() or 1, len(sources))
+    paths = [path for path, _ in sources]
+    sheets = [sheet for _, sheet in sources]
+    if workers <= 1:
+        frames = [clean_source(path, sheet, raw_cache, tag_sheet) for path, sheet in sources]
+    else:
+        n_sources = len(sources)
+        args = (paths, sheets, [raw_cache] * n_sources, [tag_sheet] * n_sources)
+        if PROFILER.enabled:
+            with ProcessPoolExecutor(max_workers=workers, initializer=enable_profiling) as pool:
+                results = list(pool.map(profiled_clean_source, *args))
+            for _, stages in results:
+                PROFILER.merge(stages)
+            frames = [frame for frame, _ in results]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(clean_source, *args))
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=[SOURCE_COLUMN])
+    with PROFILER.stage("merge", sum(len(frame) for frame in frames)):
+        return apply_schema(merge_frames(frames))
+
+
+def merge_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    # Per-file dtypes can differ: categories (unexpected answers) and raw columns such as timestamp_raw
+    # (datetime from Excel, text from CSV). Align them first so the merged column stays writable to Parquet.
+    dtypes: dict[str, set[str]] = {}
+    for frame in frames:
+        for col, dtype in frame.dtypes.items():
+            dtypes.setdefault(col, set()).add(str(dtype))
+    aligned = []
+    for frame in frames:
+        frame = frame.copy()
+        for col in frame.columns:
+            if isinstance(frame[col].dtype, pd.CategoricalDtype):
+                frame[col] = frame[col].astype("object")
+            elif len(dtypes[col]) > 1:
+                frame[col] = frame[col].astype(str).where(frame[col].notna(), None)
+        aligned.append(frame)
+    return pd.concat(aligned, ignore_index=True)
+
+
+def safe_write(df: pd.DataFrame, output_parquet: Path, output_csv: Path) -> None:
+    # The encoders are independent and pyarrow releases the GIL, so the Parquet write overlaps the CSV one.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        csv_job = pool.submit(atomic_write, output_csv, lambda tmp: df.to_csv(tmp, index=False))
+        parquet_job = pool.submit(atomic_write, output_parquet, lambda tmp: df.to_parquet(tmp, index=False))
+        csv_job.result()
+        try:
+            parquet_job.result()
+        except ImportError:
+            # Parquet outputs are optional when no Parquet engine is installed; other errors propagate.
+            pass
+
+
+def derive_stages(outputs: list[tuple[Path, Path]]) -> None:
+    """Publish the later stages (processed) from the first one (interim).
+
+    The processed dataset currently has no transformation of its own, so its files are linked to the
+    interim files instead of being encoded again; files that already share the interim inode are left alone.
+    """
+    source_parquet, source_csv = outputs[0]
+    for output_parquet, output_csv in outputs[1:]:
+        link_artifact(source_csv, output_csv)
+        if source_parquet.exists():
+            link_artifact(source_parquet, output_parquet)
+
+
+class AppendWriter:
+    """Append cleaned batches to a CSV/Parquet pair, fixing the Parquet schema on the first batch.
+
+    Batches go to temp files that replace the live outputs only when the writer closes cleanly.
+    """
+
+    def __init__(self, output_parquet: Path, output_csv: Path) -> None:
+        self.output_parquet = output_parquet
+        self.output_csv = output_csv
+        self.rows = 0
+        self._tmp_parquet = temp_path(output_parquet)
+        self._tmp_csv = temp_path(output_csv)
+        self._parquet_writer = None
+        self._schema = None
+        self._parquet_enabled = True
+
+    def __enter__(self) -> AppendWriter:
+        self.output_parquet.parent.mkdir(parents=True, exist_ok=True)
+        self.output_csv.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_csv.unlink(missing_ok=True)
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if exc_type is not None:
+            self._tmp_csv.unlink(missing_ok=True)
+            self._tmp_parquet.unlink(missing_ok=True)
+            return
+        if not self._tmp_csv.exists():
+            self._tmp_csv.touch()
+        publish(self._tmp_csv, self.output_csv)
+        if self._parquet_writer is not None:
+            publish(self._tmp_parquet, self.output_parquet)
+
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._tmp_csv, mode="a", header=self.rows == 0, index=False)
+        self.rows += len(df)
+        if self._parquet_enabled:
+            try:
+                self._write_parquet(df)
+            except ImportError:
+                self._parquet_enabled = False
+
+    def _write_parquet(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._schema is None:
+            # A batch may have an all-null text column, so type those as string up front
+            # to keep every later batch castable to one schema.
+            inferred = pa.Schema.from_pandas(df, preserve_index=False)
+            fields = []
+            for field in inferred:
+                if pa.types.is_null(field.type):
+                    field = field.with_type(pa.string())
+                fields.append(field)
+            self._schema = pa.schema(fields, metadata=inferred.metadata)
+            self._parquet_writer = pq.ParquetWriter(self._tmp_parquet, self._schema)
+        table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        self._parquet_writer.write_table(table)
+
+
+def max_timestamp(df: pd.DataFrame) -> pd.Timestamp | None:
+    if "timestamp" not in df.columns:
+        return None
+    latest = df["timestamp"].max()
+    return None if pd.isna(latest) else latest
+
+
+def safe_write_artifact(
+    frame: pd.DataFrame, output_parquet: Path | None, write: Callable[[pd.DataFrame, Path], None]
+) -> None:
+    if output_parquet is None:
+        return
+    try:
+        atomic_write(output_parquet, lambda tmp: write(frame, tmp))
+    except ImportError:
+        pass
+
+
+def stream_clean(
+    raw_file: Path,
+    outputs: list[tuple[Path, Path]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cube_parquet: Path | None = None,
+    associations_parquet: Path | None = None,
+    raw_cache: RawCache | None = None,
+) -> tuple[int, int, pd.Timestamp | None]:
+    n_rows, n_cols = 0, 0
+    watermark = None
+    cube_parts: list[pd.DataFrame] = []
+    associations = ContingencyAccumulator()
+    with AppendWriter(*outputs[0]) as writer:
+        batches = iter_raw_batches(raw_file, batch_size, raw_cache=raw_cache)
+        for batch in PROFILER.iter_stage("read_raw", batches):
+            cleaned = clean_frame(batch)
+            if cleaned.empty:
+                continue
+            with PROFILER.stage("write", len(cleaned)):
+                writer.write(cleaned)
+            n_rows += len(cleaned)
+            n_cols = len(cleaned.columns)
+            latest = max_timestamp(cleaned)
+            if latest is not None and (watermark is None or latest > watermark):
+                watermark = latest
+            with PROFILER.stage("cube", len(cleaned)):
+                cube_parts.append(build_cube(cleaned))
+                if len(cube_parts) >= CUBE_MERGE_EVERY:
+                    cube_parts = [merge_cubes(cube_parts)]
+            with PROFILER.stage("associations", len(cleaned)):
+                associations.update(cleaned)
+    with PROFILER.stage("derive", n_rows):
+        derive_stages(outputs)
+    with PROFILER.stage("cube"):
+        safe_write_artifact(merge_cubes(cube_parts), cube_parquet, write_cube)
+    with PROFILER.stage("associations"):
+        safe_write_artifact(associations.results(), associations_parquet, write_associations)
+    return n_rows, n_cols, watermark
+
+
+def full_clean(
+    raw_file: Path,
+    outputs: list[tuple[Path, Path]],
+    stream: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cube_parquet: Path | None = None,
+    associations_parquet: Path | None = None,
+    raw_cache: RawCache | None = None,
+) -> tuple[int, int, pd.Timestamp | None]:
+    if stream:
+        return stream_clean(
+            raw_file,
+            outputs,
+            batch_size=batch_size,
+            cube_parquet=cube_parquet,
+            associations_parquet=associations_parquet,
+            raw_cache=raw_cache,
+        )
+    cleaned = load_and_clean(raw_file, raw_cache=raw_cache)
+    return write_outputs(cleaned, outputs, cube_parquet, associations_parquet)
+
+
+def write_outputs(
+    cleaned: pd.DataFrame,
+    outputs: list[tuple[Path, Path]],
+    cube_parquet: Path | None = None,
+    associations_parquet: Path | None = None,
+) -> tuple[int, int, pd.Timestamp | None]:
+    n_rows = len(cleaned)
+    with PROFILER.stage("write", n_rows):
+        safe_write(cleaned, *outputs[0])
+    with PROFILER.stage("derive", n_rows):
+        derive_stages(outputs)
+    with PROFILER.stage("cube", n_rows):
+        safe_write_artifact(build_cube(cleaned), cube_parquet, write_cube)
+    with PROFILER.stage("associations", n_rows):
+        safe_write_artifact(association_results(cleaned), associations_parquet, write_associations)
+    return n_rows, len(cleaned.columns), max_timestamp(cleaned)
+
+
+def canonical_cells(df: pd.DataFrame) -> pd.DataFrame:
+    # One text form per raw value whatever dtype a batch inferred (1, 1.0 and "1" from a CSV chunk all
+    # read "1.0"), so the digest does not depend on how the file was split into batches.
+    cells = {}
+    for col in df.columns:
+        values = df[col]
+        text = values.astype(str)
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            numbers = pd.to_numeric(values, errors="coerce")
+            text = text.where(numbers.isna(), numbers.astype("float64").astype(str))
+        cells[col] = text.where(values.notna(), "")
+    return pd.DataFrame(cells, index=df.index)
+
+
+def update_row_digest(digest: hashlib._Hash, df: pd.DataFrame) -> None:
+    """Feed the rows of a raw batch, in order, into `digest`."""
+    if len(df):
+        digest.update(pd.util.hash_pandas_object(canonical_cells(df), index=False).to_numpy().tobytes())
+
+
+def raw_digest(raw_file: Path, batch_size: int = DEFAULT_BATCH_SIZE, raw_cache: RawCache | None = None) -> str:
+    """Digest of every raw response row, as `incremental_clean` reads them."""
+    digest = hashlib.sha256()
+    for batch in iter_raw_batches(raw_file, batch_size, raw_cache=raw_cache):
+        update_row_digest(digest, rename_columns(batch.dropna(how="all")))
+    return digest.hexdigest()
+
+
+def load_state(state_file: Path) -> dict | None:
+    if not state_file.exists():
+        return None
+    try:
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state if state.get("version") == STATE_VERSION else None
+
+
+def save_state(
+    state_file: Path,
+    fingerprint: str,
+    n_rows: int,
+    n_cols: int,
+    watermark: pd.Timestamp | None,
+    rows_sha256: str,
+) -> None:
+    state = {
+        "version": STATE_VERSION,
+        "sha256": fingerprint,
+        "rows_sha256": rows_sha256,
+        "rows": n_rows,
+        "columns": n_cols,
+        "watermark": None if watermark is None else watermark.isoformat(),
+    }
+    atomic_write(state_file, lambda tmp: tmp.write_text(json.dumps(state, indent=2), encoding="utf-8"))
+
+
+def append_outputs(df: pd.DataFrame, output_parquet: Path, output_csv: Path) -> None:
+    def append_csv(tmp: Path) -> None:
+        exists = output_csv.exists()
+        if exists:
+            shutil.copyfile(output_csv, tmp)
+        df.to_csv(tmp, mode="a", header=not exists, index=False)
+
+    atomic_write(output_csv, append_csv)
+    if output_parquet.exists():
+        df = apply_schema(pd.concat([pd.read_parquet(output_parquet), df], ignore_index=True))
+    try:
+        atomic_write(output_parquet, lambda tmp: df.to_parquet(tmp, index=False))
+    except ImportError:
+        pass
+
+
+def raw_timestamps(df: pd.DataFrame) -> pd.Series:
+    if "timestamp_raw" not in df.columns:
+        return pd.Series(pd.NaT, index=df.index)
+    return cast_timestamp(df[["timestamp_raw"]].copy())["timestamp"]
+
+
+def incremental_clean(
+    raw_file: Path,
+    outputs: list[tuple[Path, Path]],
+    state_file: Path,
+    stream: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cube_parquet: Path | None = None,
+    associations_parquet: Path | None = None,
+    raw_cache: RawCache | None = None,
+) -> tuple[str, int, int, int]:
+    """Return (status, total rows, new rows, columns); status is unchanged, appended or full."""
+    with PROFILER.stage("fingerprint"):
+        fingerprint = file_fingerprint(raw_file)
+    state = load_state(state_file)
+    outputs_exist = all(csv.exists() for _, csv in outputs)
+    if cube_parquet is not None:
+        outputs_exist = outputs_exist and cube_parquet.exists()
+
+    if state is not None and outputs_exist and state["sha256"] == fingerprint:
+        return "unchanged", state["rows"], 0, state["columns"]
+
+    if state is not None and outputs_exist and state["watermark"] is not None:
+        watermark = pd.Timestamp(state["watermark"])
+        seen = 0
+        fresh: list[pd.DataFrame] = []
+        # Digests of the rows already processed (at or before the watermark) and of every row read now.
+        seen_digest, rows_digest = hashlib.sha256(), hashlib.sha256()
+        batches = iter_raw_batches(raw_file, batch_size, raw_cache=raw_cache)
+        for batch in PROFILER.iter_stage("read_raw", batches):
+            with PROFILER.stage("watermark", len(batch)):
+                batch = rename_columns(batch.dropna(how="all"))
+                is_new = raw_timestamps(batch) > watermark
+                update_row_digest(seen_digest, batch[~is_new])
+                update_row_digest(rows_digest, batch)
+            seen += int((~is_new).sum())
+            if is_new.any():
+                fresh.append(clean_frame(batch[is_new]))
+
+        # Only trust the watermark when every previously processed row is still there unchanged;
+        # edits or deletions in older responses fall back to a full rebuild.
+        if seen == state["rows"] and seen_digest.hexdigest() == state["rows_sha256"]:
+            new_rows = pd.concat(fresh, ignore_index=True) if fresh else pd.DataFrame()
+            if not new_rows.empty:
+                with PROFILER.stage("write", len(new_rows)):
+                    append_outputs(new_rows, *outputs[0])
+                with PROFILER.stage("derive", len(new_rows)):
+                    derive_stages(outputs)
+                if cube_parquet is not None:
+                    with PROFILER.stage("cube", len(new_rows)):
+                        cube = merge_cubes([read_cube(cube_parquet), build_cube(new_rows)])
+                        safe_write_artifact(cube, cube_parquet, write_cube)
+                if associations_parquet is not None:
+                    with PROFILER.stage("associations") as stage:
+                        # Contingency counts are not stored, so rebuild them from the updated processed output.
+                        processed = read_processed(outputs[-1][0], columns=QUESTION_COLUMNS)
+                        stage.rows = len(processed)
+                        safe_write_artifact(
+                            association_results(processed), associations_parquet, write_associations
+                        )
+            n_rows = state["rows"] + len(new_rows)
+            latest = max_timestamp(new_rows)
+            # Every row read now is at or before the new watermark, so all of them are "seen" next time.
+            save_state(
+                state_file,
+                fingerprint,
+                n_rows,
+                state["columns"],
+                latest if latest is not None else watermark,
+                rows_digest.hexdigest(),
+            )
+            return "appended", n_rows, len(new_rows), state["columns"]
+
+    n_rows, n_cols, watermark = full_clean(
+        raw_file,
+        outputs,
+        stream=stream,
+        batch_size=batch_size,
+        cube_parquet=cube_parquet,
+        associations_parquet=associations_parquet,
+        raw_cache=raw_cache,
+    )
+    with PROFILER.stage("digest"):
+        rows_sha256 = raw_digest(raw_file, batch_size, raw_cache)
+    save_state(state_file, fingerprint, n_rows, n_cols, watermark, rows_sha256)
+    return "full", n_rows, n_rows, n_cols
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Clean raw survey dataset.")
+    parser.add_argument(
+        "--raw-file",
+        type=Path,
+        default=Path("data/raw/survey_covid_2021.xlsx"),
+        help="Path to raw Excel file.",
+    )
+    parser.add_argument(
+        "--raw-glob",
+        type=str,
+        default=None,
+        help="Directory or glob of raw .xlsx/.csv files (e.g. 'data/raw/waves/*.xlsx') to clean in parallel "
+        "and merge; replaces --raw-file and adds a source_file column.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --raw-glob/--all-sheets (default: CPU count).",
+    )
+    parser.add_argument(
+        "--all-sheets",
+        action="store_true",
+        help="Clean every workbook sheet whose headers match the survey schema (one worker per sheet) "
+        "and union them, adding a source_sheet column.",
+    )
+    parser.add_argument(
+        "--interim-parquet",
+        type=Path,
+        default=Path("data/interim/survey_clean_stage.parquet"),
+        help="Path to interim parquet output.",
+    )
+    parser.add_argument(
+        "--processed-parquet",
+        type=Path,
+        default=Path("data/processed/survey_analytics.parquet"),
+        help="Path to processed parquet output.",
+    )
+    parser.add_argument(
+        "--cube-parquet",
+        type=Path,
+        default=Path("data/processed/survey_cube.parquet"),
+        help="Path to the pre-aggregated dashboard cube (parquet).",
+    )
+    parser.add_argument(
+        "--associations-parquet",
+        type=Path,
+        default=Path("data/processed/survey_associations.parquet"),
+        help="Path to the pairwise chi-square / Cramer's V results for all questions (parquet).",
+    )
+    parser.add_argument(
+        "--partitioned-dir",
+        type=Path,
+        default=None,
+        help="Also write the processed data as a Parquet dataset partitioned by year/month of timestamp.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read and clean the raw file in row batches to keep memory bounded.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per batch in --stream mode.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip the run when the raw file is unchanged and append only responses newer than the last run.",
+    )
+    parser.add_argument(
+        "--state-file",
+        type=Path,
+        default=Path("data/processed/survey_analytics.state.json"),
+        help="Path to the fingerprint/watermark state used by --incremental; single-file runs rewrite it, "
+        "--raw-glob/--all-sheets runs delete it.",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        type=Path,
+        default=Path("data/processed/survey_metrics.json"),
+        help="Headline KPIs, chi-square tests and row counts read by the dashboard and the PDF reports.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=Path("data/processed/manifest.json"),
+        help="Manifest with row count and SHA-256 of every published output; the pipeline lock sits next to it.",
+    )
+    parser.add_argument(
+        "--header-map",
+        type=Path,
+        default=Path("data/interim/header_mappings.json"),
+        help="JSON of raw headers matched by similarity to a known column; reused and extended on each run.",
+    )
+    parser.add_argument(
+        "--raw-cache-dir",
+        type=Path,
+        default=Path("data/interim/raw_cache"),
+        help="Directory of Parquet snapshots of raw Excel sheets, keyed by file hash and sheet name.",
+    )
+    parser.add_argument(
+        "--raw-cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Size cap of the raw snapshot cache; least recently used snapshots are evicted first.",
+    )
+    parser.add_argument(
+        "--no-raw-cache",
+        action="store_true",
+        help="Always parse the raw Excel file instead of reading or writing snapshots.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall/CPU time, memory and rows per pipeline stage, print them and write --profile-report.",
+    )
+    parser.add_argument(
+        "--profile-report",
+        type=Path,
+        default=Path("data/processed/pipeline_profile.json"),
+        help="JSON stage report written by --profile.",
+    )
+    args = parser.parse_args()
+    if (args.raw_glob is not None or args.all_sheets) and (args.stream or args.incremental):
+        parser.error("--raw-glob/--all-sheets cannot be combined with --stream or --incremental.")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    if args.profile:
+        PROFILER.enable()
+
+    raw_file = resolve_project_path(args.raw_file)
+    interim_parquet = resolve_project_path(args.interim_parquet)
+    processed_parquet = resolve_project_path(args.processed_parquet)
+    interim_csv = PROJECT_ROOT / "data/interim/survey_clean_stage.csv"
+    processed_csv = PROJECT_ROOT / "data/processed/survey_analytics.csv"
+
+    cube_parquet = resolve_project_path(args.cube_parquet)
+    associations_parquet = resolve_project_path(args.associations_parquet)
+    outputs = [(interim_parquet, interim_csv), (processed_parquet, processed_csv)]
+    HEADER_RESOLVER.load(resolve_project_path(args.header_map))
+    raw_cache = None
+    if not args.no_raw_cache:
+        raw_cache = RawCache(resolve_project_path(args.raw_cache_dir), args.raw_cache_max_mb * 1024 * 1024)
+
+    partitioned_dir = resolve_project_path(args.partitioned_dir) if args.partitioned_dir is not None else None
+    metrics_path = resolve_project_path(args.metrics_json)
+    manifest_path = resolve_project_path(args.manifest)
+    if partitioned_dir is not None and not replaceable_dir(partitioned_dir, DATASET_MARKER):
+        raise SystemExit(
+            f"{rel_or_abs(partitioned_dir)} exists and was not written by this pipeline (no {DATASET_MARKER}); "
+            "remove it or choose another --partitioned-dir."
+        )
+    state_file = resolve_project_path(args.state_file)
+    status = "full"
+    manifest = None
+    datasets = {}
+    # One run at a time per output tree; readers are safe regardless since every file is swapped in atomically.
+    with pipeline_lock(manifest_path.with_name(LOCK_NAME)):
+        if not args.incremental:
+            # The --incremental state describes the published outputs; drop it before replacing them so an
+            # interrupted run can never leave a state that vouches for outputs it did not produce.
+            state_file.unlink(missing_ok=True)
+        if args.raw_glob is not None or args.all_sheets:
+            raw_files = collect_raw_files(args.raw_glob) if args.raw_glob is not None else [raw_file]
+            if not raw_files:
+                raise SystemExit(f"No raw .xlsx/.csv files match {args.raw_glob!r}.")
+            sources = collect_sources(raw_files, all_sheets=args.all_sheets)
+            if not sources:
+                raise SystemExit("No sheet matches the survey headers.")
+            cleaned = parallel_clean(sources, workers=args.workers, raw_cache=raw_cache, tag_sheet=args.all_sheets)
+            n_rows, n_cols, _ = write_outputs(cleaned, outputs, cube_parquet, associations_parquet)
+            print(f"Raw files: {len(raw_files)}")
+            if args.all_sheets:
+                print(f"Sheets: {len(sources)}")
+        elif args.incremental:
+            status, n_rows, n_new, n_cols = incremental_clean(
+                raw_file,
+                outputs,
+                state_file,
+                stream=args.stream,
+                batch_size=args.batch_size,
+                cube_parquet=cube_parquet,
+                associations_parquet=associations_parquet,
+                raw_cache=raw_cache,
+            )
+            print(f"Incremental run: {status} ({n_new} rows cleaned)")
+        else:
+            with PROFILER.stage("fingerprint"):
+                fingerprint = file_fingerprint(raw_file)
+            n_rows, n_cols, watermark = full_clean(
+                raw_file,
+                outputs,
+                stream=args.stream,
+                batch_size=args.batch_size,
+                cube_parquet=cube_parquet,
+                associations_parquet=associations_parquet,
+                raw_cache=raw_cache,
+            )
+            # Outputs of --raw-file alone, so a later --incremental run can skip or append against them.
+            # Multi-file runs leave no state, and the next --incremental run rebuilds from --raw-file.
+            with PROFILER.stage("digest"):
+                rows_sha256 = raw_digest(raw_file, args.batch_size, raw_cache)
+            save_state(state_file, fingerprint, n_rows, n_cols, watermark, rows_sha256)
+
+        if partitioned_dir is not None:
+            # Rebuilt whenever the processed file changed since it was last written, including by runs
+            # that did not pass --partitioned-dir; the manifest records which version it came from.
+            partitioned_key = Path(rel_or_abs(partitioned_dir)).as_posix()
+            stale = not dataset_is_current(read_manifest(manifest_path), partitioned_key)
+            if status != "unchanged" or stale or not partitioned_dir.exists():
+                with PROFILER.stage("partitioned", n_rows):
+                    atomic_write_dir(
+                        partitioned_dir, lambda tmp: write_partitioned(processed_parquet, tmp), DATASET_MARKER
+                    )
+                source = Path(rel_or_abs(processed_parquet)).as_posix()
+                datasets[partitioned_key] = {"rows": n_rows, "source": source}
+
+        # Derived from the cube this run just published (a few hundred cells), never from the rows.
+        refresh_metrics = (status != "unchanged" or not metrics_path.exists()) and cube_parquet.exists()
+        if refresh_metrics:
+            with PROFILER.stage("metrics"):
+                write_metrics(build_metrics(read_cube(cube_parquet)), metrics_path)
+
+        if status != "unchanged" or refresh_metrics or datasets or not manifest_path.exists():
+            artifacts = [path for pair in outputs for path in pair]
+            artifacts += [cube_parquet, associations_parquet, metrics_path]
+            with PROFILER.stage("manifest"):
+                manifest = publish_manifest(
+                    manifest_path, {Path(rel_or_abs(path)).as_posix(): path for path in artifacts}, datasets
+                )
+
+    HEADER_RESOLVER.save()
+
+    print(f"Rows: {n_rows}")
+    print(f"Columns: {n_cols}")
+    print(f"Interim CSV: {rel_or_abs(interim_csv)}")
+    print(f"Processed CSV: {rel_or_abs(processed_csv)}")
+    print(f"Cube: {rel_or_abs(cube_parquet)}")
+    print(f"Associations: {rel_or_abs(associations_parquet)}")
+    print(f"Metrics: {rel_or_abs(metrics_path)}")
+    if partitioned_dir is not None:
+        print(f"Partitioned dataset: {rel_or_abs(partitioned_dir)}")
+    if manifest is not None:
+        print(f"Manifest: {rel_or_abs(manifest_path)} (generation {manifest['generation']})")
+
+    if args.profile:
+        mode = "incremental" if args.incremental else "stream" if args.stream else "full"
+        if args.raw_glob is not None or args.all_sheets:
+            mode = "parallel"
+        report = PROFILER.report(mode=mode, status=status, rows=n_rows, columns=n_cols)
+        profile_path = resolve_project_path(args.profile_report)
+        write_report(profile_path, report)
+        print()
+        print(format_report(report))
+        print(f"Profile: {rel_or_abs(profile_path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import pandas as pd
+
+from src.data.schema import SCORE_DTYPES, apply_schema
+
+
+# One cube cell per combination of the dashboard filter/breakdown dimensions and capture day.
+CUBE_DIMENSIONS = ["gender", "q3_impact", "q15_wellbeing_final", "q4_problems", "day"]
+CUBE_SCORES = list(SCORE_DTYPES)
+HIGH_ANXIETY_MIN = 3
+
+
+def build_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate cleaned rows into additive cells: row count, high-anxiety count, score sums and counts."""
+    base = pd.DataFrame(index=df.index)
+    for col in CUBE_DIMENSIONS[:-1]:
+        base[col] = df[col] if col in df.columns else pd.Series(pd.NA, index=df.index, dtype="object")
+    base["day"] = df["timestamp"].dt.normalize() if "timestamp" in df.columns else pd.NaT
+
+    base["n"] = 1
+    if "q14_anxiety_score" in df.columns:
+        base["anxiety_high"] = df["q14_anxiety_score"].ge(HIGH_ANXIETY_MIN).fillna(False).astype("int64")
+    else:
+        base["anxiety_high"] = 0
+    for col in CUBE_SCORES:
+        scores = df[col].astype("float64") if col in df.columns else pd.Series(float("nan"), index=df.index)
+        base[f"{col}_sum"] = scores.fillna(0.0)
+        base[f"{col}_n"] = scores.notna().astype("int64")
+
+    return merge_cubes([base])
+
+
+def merge_cubes(cubes: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Re-aggregate cube parts (or raw cell rows) into one cube; cells are additive."""
+    parts = [cube for cube in cubes if not cube.empty]
+    if not parts:
+        return pd.DataFrame(columns=CUBE_DIMENSIONS + cube_measures())
+    combined = pd.concat(parts, ignore_index=True)
+    for col in CUBE_DIMENSIONS[:-1]:
+        combined[col] = combined[col].astype("object")
+    cube = combined.groupby(CUBE_DIMENSIONS, dropna=False, sort=False)[cube_measures()].sum().reset_index()
+    return apply_schema(cube)
+
+
+def cube_measures() -> list[str]:
+    measures = ["n", "anxiety_high"]
+    for col in CUBE_SCORES:
+        measures.extend([f"{col}_sum", f"{col}_n"])
+    return measures
+
+
+def write_cube(cube: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cube.to_parquet(path, index=False)
+
+
+def cube_total(cube: pd.DataFrame, col: str = "n") -> int:
+    return int(cube[col].sum())
+
+
+def cube_count(cube: pd.DataFrame, col: str, values: Sequence[str]) -> int:
+    return int(cube.loc[cube[col].isin(values), "n"].sum())
+
+
+def cube_share(cube: pd.DataFrame, col: str, values: Sequence[str]) -> float:
+    """Percentage of responses whose `col` is in `values` (missing answers count in the denominator)."""
+    total = cube_total(cube)
+    if total == 0:
+        return float("nan")
+    return round(cube_count(cube, col, values) / total * 100, 2)
+
+
+def cube_counts(cube: pd.DataFrame, col: str, missing_label: str | None = None) -> pd.Series:
+    keys = cube[col].astype("object")
+    if missing_label is not None:
+        keys = keys.fillna(missing_label)
+    return cube["n"].groupby(keys, dropna=True).sum().sort_values(ascending=False)
+
+
+def cube_crosstab(cube: pd.DataFrame, index: str, columns: str) -> pd.DataFrame:
+    sub = cube.dropna(subset=[index, columns])
+    table = sub.pivot_table(values="n", index=index, columns=columns, aggfunc="sum", fill_value=0, observed=True)
+    table = table.loc[table.sum(axis=1) > 0, table.sum(axis=0) > 0]
+    return table.astype("int64")
+
+
+def cube_anxiety_table(cube: pd.DataFrame, index: str) -> pd.DataFrame:
+    """Contingency table of `index` vs high anxiety (score >= 3, missing scores count as not high)."""
+    sub = cube.dropna(subset=[index])
+    grouped = sub.groupby(index, observed=True)[["n", "anxiety_high"]].sum()
+    table = pd.DataFrame({"High": grouped["anxiety_high"], "Not high": grouped["n"] - grouped["anxiety_high"]})
+    table = table.loc[table.sum(axis=1) > 0, table.sum(axis=0) > 0]
+    return table.astype("int64")
+
+
+def cube_means(cube: pd.DataFrame, scores: Sequence[str]) -> pd.Series:
+    sums = pd.Series({col: cube[f"{col}_sum"].sum() for col in scores}, dtype="float64")
+    counts = pd.Series({col: cube[f"{col}_n"].sum() for col in scores}, dtype="float64")
+    return sums / counts.where(counts > 0)
+
+
+def read_cube(path: Path) -> pd.DataFrame:
+    return apply_schema(pd.read_parquet(path))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import difflib
+import json
+import os
+import re
+import unicodedata
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+
+# Near-miss headers must be at least this similar (difflib ratio on canonical text) to be renamed.
+FUZZY_CUTOFF = 0.88
+QUESTION_NUMBER = re.compile(r"^(\d+)\s*[.-]")
+
+
+def canonical_col(name: object) -> str:
+    text = str(name).strip().lower()
+    text = "".join(
+        ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch)
+    )
+    text = re.sub(r"\s+", " ", text)
+    return text
+
+
+def question_number(canonical: str) -> str | None:
+    match = QUESTION_NUMBER.match(canonical)
+    return match.group(1) if match else None
+
+
+class HeaderResolver:
+    """Map raw survey headers to column names: exact canonical lookup, then a cached fuzzy fallback.
+
+    The canonical lookup table is compiled once. Every raw header is resolved at most once per
+    process (the answer, including "no match", is memoized), and fuzzy matches are kept in a
+    learned table that can be persisted so later runs resolve them without a similarity search.
+    Numbered question headers ("10.-...") only fuzzy-match targets with the same number, since
+    sibling questions share most of their wording.
+    """
+
+    def __init__(self, mapping: Mapping[str, str], cutoff: float = FUZZY_CUTOFF) -> None:
+        self.cutoff = cutoff
+        self.exact = {canonical_col(source): target for source, target in mapping.items()}
+        self.by_number: dict[str | None, list[str]] = {}
+        for key in self.exact:
+            self.by_number.setdefault(question_number(key), []).append(key)
+        self.learned: dict[str, str] = {}
+        self.path: Path | None = None
+        self._memo: dict[str, tuple[str | None, bool]] = {}
+        self._dirty = False
+
+    def resolve(self, header: object) -> tuple[str | None, bool]:
+        """Return (target, fuzzy) for one raw header; target is None when nothing is close enough."""
+        raw = str(header)
+        cached = self._memo.get(raw)
+        if cached is not None:
+            return cached
+
+        key = canonical_col(raw)
+        if key in self.exact:
+            result = (self.exact[key], False)
+        elif raw in self.learned:
+            result = (self.learned[raw], True)
+        else:
+            candidates = self.by_number.get(question_number(key), [])
+            close = difflib.get_close_matches(key, candidates, n=1, cutoff=self.cutoff)
+            result = (self.exact[close[0]], True) if close else (None, False)
+            if close:
+                self.learned[raw] = result[0]
+                self._dirty = True
+        self._memo[raw] = result
+        return result
+
+    def rename_map(self, columns: Iterable[object]) -> dict[object, str]:
+        resolved = {col: self.resolve(col) for col in columns}
+        rename = {col: target for col, (target, fuzzy) in resolved.items() if target is not None and not fuzzy}
+        claimed = set(rename.values())
+        # A fuzzy match never takes a column name that an exact header in the same file already has.
+        for col, (target, fuzzy) in resolved.items():
+            if fuzzy and target not in claimed:
+                rename[col] = target
+                claimed.add(target)
+        return rename
+
+    def load(self, path: Path) -> None:
+        self.path = path
+        if not path.exists():
+            return
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        targets = set(self.exact.values())
+        self.learned.update({raw: target for raw, target in stored.items() if target in targets})
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        # Merge with what other processes may have written since this one loaded the file.
+        current = {}
+        if self.path.exists():
+            try:
+                current = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                current = {}
+        current.update(self.learned)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(current, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.path)
+        self._dirty = False
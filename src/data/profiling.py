@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from src.data.artifacts import atomic_write
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+REPORT_VERSION = 1
+MB = 1024 * 1024
+
+
+def peak_rss_bytes() -> int | None:
+    """High-water mark of the resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    rows: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    alloc_delta_bytes: int = 0
+    alloc_peak_bytes: int = 0
+    rss_growth_bytes: int = 0
+    peak_rss_bytes: int = 0
+
+    def add(self, other: StageStats) -> None:
+        self.calls += other.calls
+        self.rows += other.rows
+        self.wall_s += other.wall_s
+        self.cpu_s += other.cpu_s
+        self.alloc_delta_bytes += other.alloc_delta_bytes
+        self.alloc_peak_bytes = max(self.alloc_peak_bytes, other.alloc_peak_bytes)
+        self.rss_growth_bytes += other.rss_growth_bytes
+        self.peak_rss_bytes = max(self.peak_rss_bytes, other.peak_rss_bytes)
+
+
+class StageProfiler:
+    """Wall time, CPU time, memory and row counts per pipeline stage, summed over repeated calls.
+
+    Disabled by default, in which case `stage` is a near no-op. When enabled, tracemalloc
+    tracks Python-level allocations (pandas/NumPy buffers included; pyarrow's own pool is not), so
+    the pipeline runs noticeably slower and the report is for comparing stages and runs, not for
+    absolute timings. Stages may nest; an outer stage includes the cost of its inner stages.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.trace_memory = False
+        self.stages: dict[str, StageStats] = {}
+        self._open: list[list[int]] = []
+        self._started = 0.0
+
+    def enable(self, trace_memory: bool = True) -> None:
+        # Without trace_memory the allocation columns stay 0 and timings are not skewed by tracemalloc.
+        if self.enabled:
+            return
+        self.enabled = True
+        self.trace_memory = trace_memory
+        self._started = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _traced(self) -> tuple[int, int]:
+        return tracemalloc.get_traced_memory() if self.trace_memory else (0, 0)
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0) -> Iterator[StageStats]:
+        """Profile the block as stage `name`; set `.rows` on the yielded stats when rows are known only later."""
+        stats = StageStats(calls=1, rows=rows)
+        if not self.enabled:
+            yield stats
+            return
+        current, peak = self._traced()
+        # reset_peak is global: hand the peak seen so far to the enclosing stages before resetting it.
+        for frame in self._open:
+            frame[1] = max(frame[1], peak)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        frame = [current, current]
+        self._open.append(frame)
+        rss_before = peak_rss_bytes() or 0
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield stats
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            current, peak = self._traced()
+            self._open.pop()
+            frame[1] = max(frame[1], peak)
+            for outer in self._open:
+                outer[1] = max(outer[1], frame[1])
+            rss_after = peak_rss_bytes() or 0
+            stats.wall_s, stats.cpu_s = wall, cpu
+            stats.alloc_delta_bytes = current - frame[0]
+            stats.alloc_peak_bytes = frame[1] - frame[0]
+            stats.rss_growth_bytes = rss_after - rss_before
+            stats.peak_rss_bytes = rss_after
+            self.stages.setdefault(name, StageStats()).add(stats)
+
+    def iter_stage(self, name: str, batches: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Yield from `batches`, profiling the production of each batch (e.g. a streamed read) as `name`."""
+        iterator = iter(batches)
+        while True:
+            with self.stage(name) as stats:
+                batch = next(iterator, None)
+                if batch is not None:
+                    stats.rows = len(batch)
+            if batch is None:
+                return
+            yield batch
+
+    def drain(self) -> dict[str, StageStats]:
+        stages, self.stages = self.stages, {}
+        return stages
+
+    def merge(self, stages: dict[str, StageStats]) -> None:
+        # Stages run in worker processes: their RSS is per worker, so the peak is the largest worker.
+        for name, stats in stages.items():
+            self.stages.setdefault(name, StageStats()).add(stats)
+
+    def report(self, **meta: object) -> dict:
+        return {
+            "version": REPORT_VERSION,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "total_wall_s": round(time.perf_counter() - self._started, 4),
+            "peak_rss_bytes": peak_rss_bytes(),
+            **meta,
+            "stages": {
+                name: {key: round(value, 4) if isinstance(value, float) else value for key, value in asdict(stats).items()}
+                for name, stats in self.stages.items()
+            },
+        }
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"{'stage':<22}{'calls':>6}{'rows':>10}{'wall s':>9}{'cpu s':>9}{'alloc MB':>10}{'peak MB':>9}{'rss+ MB':>9}"
+    ]
+    for name, stats in report["stages"].items():
+        lines.append(
+            f"{name:<22}{stats['calls']:>6}{stats['rows']:>10}{stats['wall_s']:>9.3f}{stats['cpu_s']:>9.3f}"
+            f"{stats['alloc_delta_bytes'] / MB:>10.1f}{stats['alloc_peak_bytes'] / MB:>9.1f}"
+            f"{stats['rss_growth_bytes'] / MB:>9.1f}"
+        )
+    peak = report.get("peak_rss_bytes")
+    total = f"Total wall time: {report['total_wall_s']:.3f} s"
+    if peak is not None:
+        total += f", peak RSS: {peak / MB:.1f} MB"
+    lines.append(total)
+    return "\n".join(lines)
+
+
+def write_report(path: Path, report: dict) -> None:
+    atomic_write(path, lambda tmp: tmp.write_text(json.dumps(report, indent=2), encoding="utf-8"))
+
+
+PROFILER = StageProfiler()
+
+
+def enable_profiling() -> None:
+    # Module-level so it can be passed as a ProcessPoolExecutor initializer.
+    PROFILER.enable()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pandas as pd
+
+
+# Bump when the conversion itself changes so older snapshots are never read back.
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def file_fingerprint(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RawCache:
+    """Parquet snapshots of raw workbook sheets, keyed by file hash and sheet name.
+
+    A changed workbook hashes to a new key, so stale snapshots are never read; they are
+    dropped when the same workbook/sheet is converted again, and the directory is kept under
+    `max_bytes` by evicting the least recently used snapshots.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._digests: dict[Path, tuple[int, int, str]] = {}
+
+    def _digest(self, raw_file: Path) -> str:
+        stat = raw_file.stat()
+        known = self._digests.get(raw_file)
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+        digest = file_fingerprint(raw_file)
+        self._digests[raw_file] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def _prefix(self, raw_file: Path, sheet_name: str) -> str:
+        slug = re.sub(r"[^0-9A-Za-z_-]+", "_", f"{raw_file.stem}-{sheet_name}")
+        return f"{slug}-v{CACHE_VERSION}-"
+
+    def snapshot_path(self, raw_file: Path, sheet_name: str) -> Path:
+        return self.cache_dir / f"{self._prefix(raw_file, sheet_name)}{self._digest(raw_file)[:32]}.parquet"
+
+    def _hit(self, raw_file: Path, sheet_name: str) -> Path | None:
+        path = self.snapshot_path(raw_file, sheet_name)
+        if not path.exists():
+            return None
+        # Touch on read so eviction drops the least recently used snapshot first.
+        os.utime(path)
+        return path
+
+    def read(self, raw_file: Path, sheet_name: str, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        path = self._hit(raw_file, sheet_name)
+        if path is not None:
+            try:
+                return pd.read_parquet(path)
+            except Exception:
+                path.unlink(missing_ok=True)
+
+        df = loader()
+        self._store(df, raw_file, sheet_name)
+        return df
+
+    def iter_batches(self, raw_file: Path, sheet_name: str, batch_size: int) -> Iterator[pd.DataFrame] | None:
+        """Row batches from an existing snapshot, or None when the sheet has not been converted yet."""
+        path = self._hit(raw_file, sheet_name)
+        if path is None:
+            return None
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        return (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=batch_size))
+
+    def _store(self, df: pd.DataFrame, raw_file: Path, sheet_name: str) -> None:
+        path = self.snapshot_path(raw_file, sheet_name)
+        tmp = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp, index=False)
+            tmp.replace(path)
+        except Exception:
+            # Sheets Arrow cannot represent (mixed-type columns, non-text headers) are simply not cached.
+            tmp.unlink(missing_ok=True)
+            return
+        for stale in self.cache_dir.glob(f"{self._prefix(raw_file, sheet_name)}*.parquet"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        self.evict()
+
+    def evict(self) -> None:
+        snapshots = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshots.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in snapshots)
+        for _, size, path in sorted(snapshots):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*.parquet"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+
+LIKERT_LEVELS = ["Nunca", "Casi nunca", "De vez en cuando", "Casi siempre", "Siempre"]
+
+
+# Category order for every closed-answer column of the processed dataset.
+# Ordered columns are ordinal scales; the rest keep a presentation order only.
+CATEGORY_ORDER: dict[str, list[str]] = {
+    "gender": ["Hombre", "Mujer", "Otro"],
+    "q1_current_state": ["Bien", "Ni bien ni mal.", "Mal", "Prefiero no responder."],
+    "q2_emotional_state": ["Excelente", "Muy bien", "Regular", "No tan mal", "Mal"],
+    "q3_impact": ["Positiva", "Negativa"],
+    "q4_problems": ["Si", "No", "Prefiero no decir."],
+    "q5_help_seek": ["Si", "No", "Lo he pensado."],
+    "q6_pre_pandemic_state": ["Muy bien", "Bien", "Normal", "No tan mal", "Mal"],
+    "q7_learned_new_skill": ["Si", "No"],
+    "q9_future_normality": ["Si", "Tal vez", "No"],
+    "q10_stress": LIKERT_LEVELS,
+    "q11_optimism": LIKERT_LEVELS,
+    "q12_control": LIKERT_LEVELS,
+    "q13_protocols": LIKERT_LEVELS,
+    "q14_anxiety": LIKERT_LEVELS,
+    "q15_wellbeing_final": ["No", "Tal vez", "Si", "Prefiero no responder."],
+}
+ORDERED_COLUMNS = {"q10_stress", "q11_optimism", "q12_control", "q13_protocols", "q14_anxiety"}
+
+
+# Scores fit in 0..4; nullable Int8 keeps missing answers without widening to float64.
+SCORE_DTYPES: dict[str, str] = {
+    "q10_stress_score": "Int8",
+    "q11_optimism_score": "Int8",
+    "q12_control_score": "Int8",
+    "q13_protocols_score": "Int8",
+    "q14_anxiety_score": "Int8",
+    "q15_wellbeing_score": "Int8",
+}
+
+
+DATETIME_COLUMNS = ["timestamp"]
+
+
+def category_dtype(col: str, values: pd.Series | None = None) -> pd.CategoricalDtype:
+    categories = list(CATEGORY_ORDER[col])
+    ordered = col in ORDERED_COLUMNS
+    if values is not None and not ordered:
+        # Keep unexpected answers instead of silently turning them into NaN.
+        known = set(categories)
+        extra = sorted({str(v) for v in values.dropna().unique()} - known)
+        categories.extend(extra)
+    return pd.CategoricalDtype(categories=categories, ordered=ordered)
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    for col in CATEGORY_ORDER:
+        if col in df.columns:
+            values = df[col].astype("object").where(df[col].notna(), None)
+            df[col] = values.astype(category_dtype(col, values))
+
+    for col, dtype in SCORE_DTYPES.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col].astype("object"), errors="coerce").astype(dtype)
+
+    for col in DATETIME_COLUMNS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+
+    return df
+
+
+def read_processed(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    if path.suffix.lower() == ".parquet":
+        return apply_schema(pd.read_parquet(path, columns=columns))
+    return apply_schema(pd.read_csv(path, usecols=columns))
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CATALOG_DIR = Path(__file__).resolve().parent
+# Language code -> folder holding that language's documents, notebooks and portfolio PDFs.
+LANGUAGES = {"en": "English", "es": "Español"}
+DEFAULT_LANGUAGE = "en"
+
+
+@lru_cache(maxsize=None)
+def load_catalog(lang: str) -> dict[str, str]:
+    if lang not in LANGUAGES:
+        raise ValueError(f"Unsupported language {lang!r}; expected one of {sorted(LANGUAGES)}.")
+    return json.loads((CATALOG_DIR / f"{lang}.json").read_text(encoding="utf-8"))
+
+
+def language_dir(lang: str) -> Path:
+    return PROJECT_ROOT / LANGUAGES[lang]
+
+
+class Translator:
+    """Look up UI/report strings by key; keys missing in a catalog fall back to the default language."""
+
+    def __init__(self, lang: str = DEFAULT_LANGUAGE) -> None:
+        self.lang = lang
+        self.catalog = load_catalog(lang)
+        self.fallback = load_catalog(DEFAULT_LANGUAGE)
+
+    def __call__(self, key: str, **values: object) -> str:
+        text = self.catalog.get(key)
+        if text is None:
+            text = self.fallback[key]
+        return text.format(**values) if values else text
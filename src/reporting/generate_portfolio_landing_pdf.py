@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
 
 from reportlab.lib.pagesizes import LETTER
@@ -9,6 +10,14 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.analysis.metrics import read_metrics  # noqa: E402
+from src.i18n.translations import DEFAULT_LANGUAGE, LANGUAGES, language_dir  # noqa: E402
+from src.reporting.metrics_template import fill_metrics  # noqa: E402
+
+
+METRICS_PATH = PROJECT_ROOT / "data/processed/survey_metrics.json"
 
 
 def strip_md(line: str) -> str:
@@ -16,8 +25,9 @@ def strip_md(line: str) -> str:
     return text
 
 
-def build_pdf(input_md: Path, output_pdf: Path) -> None:
-    lines = input_md.read_text(encoding="utf-8").splitlines()
+def build_pdf(input_md: Path, output_pdf: Path, metrics: dict, lang: str = DEFAULT_LANGUAGE) -> None:
+    # The headline numbers are placeholders in the markdown, filled from the pipeline's metrics.
+    lines = fill_metrics(input_md.read_text(encoding="utf-8"), metrics, lang).splitlines()
 
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
@@ -108,25 +118,42 @@ def build_pdf(input_md: Path, output_pdf: Path) -> None:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate PDF from portfolio landing markdown.")
+    parser.add_argument(
+        "--lang",
+        choices=sorted(LANGUAGES),
+        default=DEFAULT_LANGUAGE,
+        help="Language folder holding the landing page.",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        type=Path,
+        default=METRICS_PATH,
+        help="Metrics published by src/data/clean_survey.py.",
+    )
     parser.add_argument(
         "--input-md",
         type=Path,
-        default=PROJECT_ROOT / "PORTAFOLIO_LANDING.md",
-        help="Input markdown file.",
+        default=None,
+        help="Input markdown file (default: PORTAFOLIO_LANDING.md in the language folder).",
     )
     parser.add_argument(
         "--output-pdf",
         type=Path,
-        default=PROJECT_ROOT / "PORTAFOLIO_LANDING.pdf",
-        help="Output PDF file.",
+        default=None,
+        help="Output PDF file (default: PORTAFOLIO_LANDING.pdf in the language folder).",
     )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    build_pdf(args.input_md, args.output_pdf)
-    print(f"PDF generated: {args.output_pdf}")
+    input_md = args.input_md if args.input_md is not None else language_dir(args.lang) / "PORTAFOLIO_LANDING.md"
+    output_pdf = args.output_pdf if args.output_pdf is not None else language_dir(args.lang) / "PORTAFOLIO_LANDING.pdf"
+    metrics = read_metrics(args.metrics_json)
+    if metrics is None:
+        raise SystemExit(f"{args.metrics_json} not found. Run first: python src/data/clean_survey.py")
+    build_pdf(input_md, output_pdf, metrics, args.lang)
+    print(f"PDF generated: {output_pdf}")
 
 
 if __name__ == "__main__":
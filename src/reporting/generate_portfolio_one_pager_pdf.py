@@ -1,34 +1,25 @@
 from __future__ import annotations
 
+import argparse
+import sys
 from pathlib import Path
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.units import inch
-from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-OUTPUT_PATH = PROJECT_ROOT / "PORTAFOLIO_ONE_PAGER.pdf"
-
-
-def wrap_text(text: str, font_name: str, font_size: float, max_width: float) -> list[str]:
-    words = text.split()
-    lines: list[str] = []
-    line = ""
-    for word in words:
-        candidate = f"{line} {word}".strip()
-        width = pdfmetrics.stringWidth(candidate, font_name, font_size)
-        if width <= max_width:
-            line = candidate
-        else:
-            if line:
-                lines.append(line)
-            line = word
-    if line:
-        lines.append(line)
-    return lines
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.analysis.metrics import kpi_values, read_metrics, significant_tests  # noqa: E402
+from src.i18n.translations import DEFAULT_LANGUAGE, LANGUAGES, Translator, language_dir  # noqa: E402
+from src.reporting.text_layout import wrap_text  # noqa: E402
+
+
+OUTPUT_NAME = "PORTAFOLIO_ONE_PAGER.pdf"
+METRICS_PATH = PROJECT_ROOT / "data/processed/survey_metrics.json"
 
 
 def draw_wrapped(
@@ -63,7 +54,17 @@ def section_title(c: canvas.Canvas, title: str, x: float, y: float) -> float:
     return y - 15
 
 
-def build_pdf(output_path: Path) -> None:
+def tests_summary(t: Translator, metrics: dict) -> str:
+    tests = significant_tests(metrics)
+    if not tests:
+        return t("one_pager.no_tests", alpha=metrics["alpha"])
+    return t("one_pager.tests", tests=", ".join(f"{test['test']} (p={test['p_value']:.6f})" for test in tests))
+
+
+def build_pdf(output_path: Path, metrics: dict, lang: str = DEFAULT_LANGUAGE, segment: str | None = None) -> None:
+    """Render the one-pager; `segment` replaces the subtitle with the segment's description."""
+    t = Translator(lang)
+    headline = kpi_values(metrics)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     c = canvas.Canvas(str(output_path), pagesize=LETTER)
     w, h = LETTER
@@ -77,12 +78,12 @@ def build_pdf(output_path: Path) -> None:
     c.rect(0, h - 1.3 * inch, w, 1.3 * inch, stroke=0, fill=1)
     c.setFillColor(colors.white)
     c.setFont("Helvetica-Bold", 18)
-    c.drawString(margin, h - 0.72 * inch, "Data Analyst Portfolio · One-Pager")
+    c.drawString(margin, h - 0.72 * inch, t("one_pager.title"))
     c.setFont("Helvetica", 10.5)
     c.drawString(
         margin,
         h - 1.0 * inch,
-        "Caso historico 2021 convertido en entrega profesional: pipeline, inferencia y dashboard.",
+        t("one_pager.subtitle") if segment is None else t("one_pager.segment", segment=segment, **headline),
     )
 
     y = h - 1.55 * inch
@@ -96,17 +97,17 @@ def build_pdf(output_path: Path) -> None:
 
     c.setFillColor(colors.HexColor("#0B132B"))
     c.setFont("Helvetica-Bold", 11)
-    c.drawString(margin + 12, y - 20, "Muestra y contexto")
+    c.drawString(margin + 12, y - 20, t("one_pager.sample_title"))
     c.setFont("Helvetica", 10)
-    c.drawString(margin + 12, y - 36, "178 respuestas · 2021 · pandemia COVID-19")
-    c.drawString(margin + 12, y - 50, "Muestra pequena y no probabilistica")
+    c.drawString(margin + 12, y - 36, t("one_pager.sample_size", **headline))
+    c.drawString(margin + 12, y - 50, t("one_pager.sample_note"))
 
     x2 = margin + card_w + 0.2 * inch + 12
     c.setFont("Helvetica-Bold", 11)
-    c.drawString(x2, y - 20, "Impacto y riesgo")
+    c.drawString(x2, y - 20, t("one_pager.risk_title"))
     c.setFont("Helvetica", 10)
-    c.drawString(x2, y - 36, "67.23% reporta problemas")
-    c.drawString(x2, y - 50, "41.01% en bienestar final de riesgo")
+    c.drawString(x2, y - 36, t("one_pager.problems", **headline))
+    c.drawString(x2, y - 50, t("one_pager.low_wellbeing", **headline))
 
     y -= card_h + 0.28 * inch
 
@@ -118,19 +119,19 @@ def build_pdf(output_path: Path) -> None:
 
     # Left column: non-technical
     yl = y
-    yl = section_title(c, "Para reclutador general", left_x, yl)
+    yl = section_title(c, t("one_pager.general_title"), left_x, yl)
     yl = draw_wrapped(
         c,
-        "Convierte datos crudos con ruido en conclusiones claras sobre bienestar emocional y factores asociados.",
+        t("one_pager.general_intro"),
         left_x,
         yl,
         col_w,
     )
     yl -= 6
-    yl = draw_wrapped(c, "Impacto negativo percibido: 51.98%.", left_x, yl, col_w, bullet=True)
+    yl = draw_wrapped(c, t("one_pager.negative", **headline), left_x, yl, col_w, bullet=True)
     yl = draw_wrapped(
         c,
-        "Hallazgo clave: reportar problemas se asocia significativamente con bienestar final y ansiedad.",
+        t("one_pager.finding"),
         left_x,
         yl,
         col_w,
@@ -138,7 +139,7 @@ def build_pdf(output_path: Path) -> None:
     )
     yl = draw_wrapped(
         c,
-        "Demuestra pensamiento estructurado, comunicacion y orientacion a decisiones.",
+        t("one_pager.skills"),
         left_x,
         yl,
         col_w,
@@ -147,19 +148,19 @@ def build_pdf(output_path: Path) -> None:
 
     # Right column: technical
     yr = y
-    yr = section_title(c, "Para reclutador tecnico", right_x, yr)
-    yr = draw_wrapped(c, "Stack: Python, pandas, scipy, scikit-learn, Jupyter, Streamlit.", right_x, yr, col_w)
+    yr = section_title(c, t("one_pager.technical_title"), right_x, yr)
+    yr = draw_wrapped(c, t("one_pager.stack"), right_x, yr, col_w)
     yr -= 6
-    yr = draw_wrapped(c, "Pipeline reproducible: raw -> interim -> processed.", right_x, yr, col_w, bullet=True)
+    yr = draw_wrapped(c, t("one_pager.pipeline"), right_x, yr, col_w, bullet=True)
     yr = draw_wrapped(
         c,
-        "Pruebas chi-cuadrada significativas: q4_problems vs q15 (p=0.000033), q4_problems vs anxiety_high (p=0.034516).",
+        tests_summary(t, metrics),
         right_x,
         yr,
         col_w,
         bullet=True,
     )
-    yr = draw_wrapped(c, "Modelo logistico exploratorio: accuracy 0.733.", right_x, yr, col_w, bullet=True)
+    yr = draw_wrapped(c, t("one_pager.model"), right_x, yr, col_w, bullet=True)
 
     y = min(yl, yr) - 10
 
@@ -168,7 +169,7 @@ def build_pdf(output_path: Path) -> None:
     c.roundRect(margin, y - 0.9 * inch, usable_w, 0.9 * inch, 8, stroke=0, fill=1)
     c.setFillColor(colors.HexColor("#0B132B"))
     c.setFont("Helvetica-Bold", 11)
-    c.drawString(margin + 12, y - 20, "Entregables listos")
+    c.drawString(margin + 12, y - 20, t("one_pager.deliverables_title"))
     c.setFont("Helvetica", 9.6)
     c.drawString(margin + 12, y - 36, "notebooks/00_resumen_ejecutivo.executed.ipynb")
     c.drawString(margin + 12, y - 50, "reports/findings.md  ·  app/streamlit_app.py")
@@ -179,19 +180,39 @@ def build_pdf(output_path: Path) -> None:
     # Disclaimer footer
     c.setFillColor(colors.HexColor("#3A506B"))
     c.setFont("Helvetica", 8.7)
-    footer = (
-        "Disclaimer: este caso utiliza una base historica (2021), no probabilistica. "
-        "Se interpreta como evidencia asociativa y demostracion de metodologia profesional."
-    )
+    footer = t("one_pager.disclaimer")
     y = draw_wrapped(c, footer, margin, y, usable_w, font_size=8.7, leading=11)
 
     c.showPage()
     c.save()
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the portfolio one-pager PDF.")
+    parser.add_argument("--lang", choices=sorted(LANGUAGES), default=DEFAULT_LANGUAGE, help="Catalog language.")
+    parser.add_argument(
+        "--metrics-json",
+        type=Path,
+        default=METRICS_PATH,
+        help="Metrics published by src/data/clean_survey.py.",
+    )
+    parser.add_argument(
+        "--output-pdf",
+        type=Path,
+        default=None,
+        help=f"Output PDF file (default: {OUTPUT_NAME} in the language folder).",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
-    build_pdf(OUTPUT_PATH)
-    print(f"PDF generated: {OUTPUT_PATH}")
+    args = parse_args()
+    output_path = args.output_pdf if args.output_pdf is not None else language_dir(args.lang) / OUTPUT_NAME
+    metrics = read_metrics(args.metrics_json)
+    if metrics is None:
+        raise SystemExit(f"{args.metrics_json} not found. Run first: python src/data/clean_survey.py")
+    build_pdf(output_path, metrics, args.lang)
+    print(f"PDF generated: {output_path}")
 
 
 if __name__ == "__main__":
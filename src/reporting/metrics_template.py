@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from src.analysis.metrics import significant_tests, template_values
+from src.i18n.translations import DEFAULT_LANGUAGE, Translator
+
+
+def significant_lines(metrics: dict, lang: str = DEFAULT_LANGUAGE) -> list[str]:
+    tests = significant_tests(metrics)
+    if not tests:
+        return [f"- {Translator(lang)('one_pager.no_tests', alpha=metrics['alpha'])}"]
+    lines = []
+    for test in tests:
+        a, b = test["test"].split(" vs ")
+        lines.append(f"- `{a}` vs `{b}` (p={test['p_value']:.6f})")
+    return lines
+
+
+def fill_metrics(template: str, metrics: dict, lang: str = DEFAULT_LANGUAGE) -> str:
+    """Fill a markdown template's `{placeholders}` from the pipeline metrics.
+
+    Fields are the `template_values` names (`{responses}`, `{negative_impact:.2f}`,
+    `{tests[q4_problems vs anxiety_high][p_value]:.6f}`, ...) plus `{significant_tests}`, one
+    bullet per significant Chi-square test. Literal braces are written `{{` and `}}`.
+    """
+    values = template_values(metrics)
+    values["significant_tests"] = "\n".join(significant_lines(metrics, lang))
+    return template.format_map(values)
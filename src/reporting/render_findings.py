@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.analysis.metrics import read_metrics  # noqa: E402
+from src.data.artifacts import atomic_write  # noqa: E402
+from src.i18n.translations import DEFAULT_LANGUAGE, LANGUAGES, language_dir  # noqa: E402
+from src.reporting.metrics_template import fill_metrics  # noqa: E402
+
+
+METRICS_PATH = PROJECT_ROOT / "data/processed/survey_metrics.json"
+TEMPLATE_NAME = "reports/findings.template.md"
+OUTPUT_NAME = "reports/findings.md"
+
+
+def render_findings(template_md: Path, output_md: Path, metrics: dict, lang: str = DEFAULT_LANGUAGE) -> None:
+    text = fill_metrics(template_md.read_text(encoding="utf-8"), metrics, lang)
+    atomic_write(output_md, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render the findings report with the pipeline's headline metrics.")
+    parser.add_argument("--lang", choices=sorted(LANGUAGES), default=DEFAULT_LANGUAGE, help="Language folder.")
+    parser.add_argument(
+        "--metrics-json",
+        type=Path,
+        default=METRICS_PATH,
+        help="Metrics published by src/data/clean_survey.py.",
+    )
+    parser.add_argument(
+        "--template-md",
+        type=Path,
+        default=None,
+        help=f"Report template (default: {TEMPLATE_NAME} in the language folder).",
+    )
+    parser.add_argument(
+        "--output-md",
+        type=Path,
+        default=None,
+        help=f"Rendered report (default: {OUTPUT_NAME} in the language folder).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    template_md = args.template_md if args.template_md is not None else language_dir(args.lang) / TEMPLATE_NAME
+    output_md = args.output_md if args.output_md is not None else language_dir(args.lang) / OUTPUT_NAME
+    metrics = read_metrics(args.metrics_json)
+    if metrics is None:
+        raise SystemExit(f"{args.metrics_json} not found. Run first: python src/data/clean_survey.py")
+    render_findings(template_md, output_md, metrics, args.lang)
+    print(f"Report generated: {output_md}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.analysis.metrics import build_segment_metrics, kpi_values, significant_tests  # noqa: E402
+from src.data.artifacts import atomic_write_dir, replaceable_dir  # noqa: E402
+from src.data.cube import CUBE_DIMENSIONS, read_cube  # noqa: E402
+from src.i18n.translations import DEFAULT_LANGUAGE, LANGUAGES  # noqa: E402
+from src.reporting.generate_portfolio_one_pager_pdf import build_pdf  # noqa: E402
+
+
+CUBE_PATH = PROJECT_ROOT / "data/processed/survey_cube.parquet"
+OUTPUT_DIR = PROJECT_ROOT / "data/reports/segments"
+# Survey wave: the capture month, derived from the cube's day dimension.
+WAVE_COLUMN = "month"
+SEGMENT_COLUMNS = [col for col in CUBE_DIMENSIONS if col != "day"] + [WAVE_COLUMN]
+MISSING_SEGMENT = "NA"
+INDEX_NAME = "index.csv"
+
+
+def segment_keys(cube: pd.DataFrame, columns: list[str]) -> list[pd.Series]:
+    # Separate key series: the cube's own columns must keep their missing values for the metrics.
+    keys = []
+    for col in columns:
+        values = cube["day"].dt.strftime("%Y-%m") if col == WAVE_COLUMN else cube[col].astype("object")
+        keys.append(values.fillna(MISSING_SEGMENT).rename(col))
+    return keys
+
+
+def segment_metrics(cube: pd.DataFrame, columns: list[str], min_responses: int = 1) -> list[tuple[dict, dict]]:
+    """(segment values, metrics) for every populated segment, in segment order.
+
+    The cube is the processed dataset pre-aggregated to additive cells, so grouping its cells gives
+    each segment exactly the headline metric definitions without touching the rows.
+    """
+    metrics = build_segment_metrics(cube, segment_keys(cube, columns))
+    return [
+        (dict(zip(columns, segment)), item)
+        for segment, item in metrics.items()
+        if item["rows"]["responses"] >= min_responses
+    ]
+
+
+def segment_label(values: dict) -> str:
+    return " · ".join(f"{col}={value}" for col, value in values.items())
+
+
+def segment_slug(values: dict) -> str:
+    parts = (f"{col}-{re.sub(r'[^0-9A-Za-z]+', '-', str(value)).strip('-')}" for col, value in values.items())
+    return "__".join(parts)
+
+
+def render_segment(output_path: Path, metrics: dict, lang: str, label: str) -> Path:
+    build_pdf(output_path, metrics, lang, segment=label)
+    return output_path
+
+
+def render_segments(jobs: list[tuple[Path, dict, str]], lang: str, workers: int | None = None) -> list[Path]:
+    """Render one PDF per (path, metrics, label) job, across a process pool when there is more than one worker."""
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    paths = [path for path, _, _ in jobs]
+    metrics = [item for _, item, _ in jobs]
+    labels = [label for _, _, label in jobs]
+    if workers <= 1:
+        return [render_segment(path, item, lang, label) for path, item, label in jobs]
+    # Rendering is CPU-bound and independent per page; chunks amortize the pickling of each job.
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_segment, paths, metrics, [lang] * len(jobs), labels, chunksize=chunksize))
+
+
+def index_rows(segments: list[tuple[dict, dict]], files: list[str]) -> pd.DataFrame:
+    rows = []
+    for (values, metrics), file in zip(segments, files):
+        kpis = kpi_values(metrics)
+        tests = significant_tests(metrics)
+        rows.append(
+            {
+                **values,
+                "segment": segment_label(values),
+                "file": file,
+                "pages": 1,
+                **kpis,
+                "significant_tests": "; ".join(test["test"] for test in tests),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def build_segment_reports(
+    cube: pd.DataFrame,
+    columns: list[str],
+    output_dir: Path,
+    lang: str = DEFAULT_LANGUAGE,
+    workers: int | None = None,
+    min_responses: int = 1,
+) -> dict[str, object]:
+    started = time.perf_counter()
+    segments = segment_metrics(cube, columns, min_responses)
+    metrics_s = time.perf_counter() - started
+    files = [f"{segment_slug(values)}.pdf" for values, _ in segments]
+    index = index_rows(segments, files)
+    render_s = 0.0
+
+    def write(tmp: Path) -> None:
+        nonlocal render_s
+        tmp.mkdir(parents=True, exist_ok=True)
+        jobs = [(tmp / file, metrics, segment_label(values)) for (values, metrics), file in zip(segments, files)]
+        render_started = time.perf_counter()
+        render_segments(jobs, lang, workers)
+        render_s = time.perf_counter() - render_started
+        index.to_csv(tmp / INDEX_NAME, index=False)
+
+    # The whole batch is swapped in at once, so the index never lists a half-written set of reports.
+    # Only a directory holding our index.csv (or an empty one) is replaced; anything else raises.
+    atomic_write_dir(output_dir, write, INDEX_NAME)
+    pages = int(index["pages"].sum()) if not index.empty else 0
+    return {
+        "segments": len(segments),
+        "pages": pages,
+        "metrics_s": metrics_s,
+        "render_s": render_s,
+        "total_s": time.perf_counter() - started,
+        "pages_per_s": pages / render_s if render_s else float("nan"),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate one one-pager PDF per survey segment.")
+    parser.add_argument(
+        "--segments",
+        nargs="+",
+        choices=SEGMENT_COLUMNS,
+        default=["gender", "q3_impact"],
+        help=f"Columns whose value combinations define the segments ({WAVE_COLUMN} = capture month).",
+    )
+    parser.add_argument("--lang", choices=sorted(LANGUAGES), default=DEFAULT_LANGUAGE, help="Catalog language.")
+    parser.add_argument("--cube-parquet", type=Path, default=CUBE_PATH, help="Cube published by clean_survey.py.")
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Directory for the PDFs and index.csv (default: data/reports/segments/<lang>).",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count).")
+    parser.add_argument("--min-responses", type=int, default=1, help="Skip segments with fewer responses.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.cube_parquet.exists():
+        raise SystemExit(f"{args.cube_parquet} not found. Run first: python src/data/clean_survey.py")
+    output_dir = args.output_dir if args.output_dir is not None else OUTPUT_DIR / args.lang
+    if not replaceable_dir(output_dir, INDEX_NAME):
+        raise SystemExit(
+            f"{output_dir} exists and holds no {INDEX_NAME} from a previous run; the whole directory is replaced, "
+            "so choose an empty or new --output-dir."
+        )
+    columns = list(dict.fromkeys(args.segments))
+    stats = build_segment_reports(
+        read_cube(args.cube_parquet),
+        columns,
+        output_dir,
+        lang=args.lang,
+        workers=args.workers,
+        min_responses=args.min_responses,
+    )
+    print(f"Segments: {stats['segments']} ({' x '.join(columns)})")
+    print(f"Metrics: {stats['metrics_s']:.3f}s")
+    print(f"Render: {stats['pages']} pages in {stats['render_s']:.3f}s ({stats['pages_per_s']:.1f} pages/s)")
+    print(f"Total: {stats['total_s']:.3f}s")
+    print(f"Index: {output_dir / INDEX_NAME}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+
+
+# Widths are cached in font units (1/1000 em) and scaled per call. For the standard fonts the unit
+# width of a string is the integer sum of its glyph widths, and `stringWidth` returns that sum
+# * 0.001 * size, so the summed cache reproduces `stringWidth` on the whole line exactly.
+UNIT_SIZE = 1000
+
+
+def font_units(text: str, font_name: str) -> float:
+    # Undo the float noise of measuring at 1000 points (sum * 1000 * 0.001) to recover the unit sum.
+    return round(pdfmetrics.stringWidth(text, font_name, UNIT_SIZE), 6)
+
+
+class FontWidths:
+    """Per-font word width cache; every size reuses the same entries."""
+
+    def __init__(self, font_name: str) -> None:
+        self.font_name = font_name
+        self.words: dict[str, float] = {}
+        self.space = font_units(" ", font_name)
+
+    def units(self, word: str) -> float:
+        width = self.words.get(word)
+        if width is None:
+            width = self.words[word] = font_units(word, self.font_name)
+        return width
+
+    def width(self, text: str, font_size: float) -> float:
+        words = text.split(" ")
+        units = sum(self.units(word) for word in words) + self.space * (len(words) - 1)
+        return units * 0.001 * font_size
+
+
+@lru_cache(maxsize=None)
+def font_widths(font_name: str) -> FontWidths:
+    return FontWidths(font_name)
+
+
+def string_width(text: str, font_name: str, font_size: float) -> float:
+    return font_widths(font_name).width(text, font_size)
+
+
+def wrap_text(text: str, font_name: str, font_size: float, max_width: float) -> list[str]:
+    """Greedy word wrap; a word wider than `max_width` gets a line of its own."""
+    widths = font_widths(font_name)
+    # Sum cached word units so each word is measured once and extending a line costs one addition.
+    lines: list[str] = []
+    line: list[str] = []
+    line_units = 0.0
+    for word in text.split():
+        units = widths.units(word)
+        candidate = line_units + widths.space + units if line else units
+        if candidate * 0.001 * font_size <= max_width or not line:
+            line.append(word)
+            line_units = candidate
+        else:
+            lines.append(" ".join(line))
+            line = [word]
+            line_units = units
+    if line:
+        lines.append(" ".join(line))
+    return lines
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from src.data.clean_survey import incremental_clean
+from src.data.cube import read_cube
+
+
+HEADERS = {
+    "timestamp": "Marca temporal",
+    "gender": "Eres... (selecciona uno)",
+    "impact": "3.-¿Esta pandemia ha tenido impacto de manera positiva o negativa hacia ti?",
+    "problems": "4.-¿Has tenido problemas sociales, emocionales, economicos o psicologicos en esta pandemia?",
+    "wellbeing": "15.-Por ultimo, siendo honestos, estas bien? ",
+}
+ROWS = [
+    ("2021-05-01 10:00:00", "Mujer", "Negativa.", "Si", "No"),
+    ("2021-05-01 11:00:00", "Hombre", "Positiva.", "No", "Si"),
+    ("2021-05-02 09:30:00", "Mujer", "Negativa.", "Si", "Tal vez"),
+]
+
+
+def write_raw(path, rows):
+    pd.DataFrame(rows, columns=list(HEADERS.values())).to_csv(path, index=False)
+
+
+@pytest.fixture
+def run(tmp_path):
+    raw = tmp_path / "raw.csv"
+    processed = tmp_path / "processed.csv"
+    outputs = [(tmp_path / "interim.parquet", tmp_path / "interim.csv"), (tmp_path / "processed.parquet", processed)]
+    cube = tmp_path / "cube.parquet"
+
+    def clean(rows):
+        write_raw(raw, rows)
+        status, n_rows, n_new, _ = incremental_clean(raw, outputs, tmp_path / "state.json", cube_parquet=cube)
+        return status, n_rows, n_new, pd.read_csv(processed), read_cube(cube)
+
+    return clean
+
+
+def test_unchanged_and_appended(run):
+    assert run(ROWS)[:3] == ("full", 3, 3)
+    assert run(ROWS)[:3] == ("unchanged", 3, 0)
+    status, n_rows, n_new, processed, cube = run(ROWS + [("2021-05-03 08:00:00", "Otro", "Positiva.", "No", "Si")])
+    assert (status, n_rows, n_new) == ("appended", 4, 1)
+    assert processed["gender"].tolist() == ["Mujer", "Hombre", "Mujer", "Otro"]
+    assert int(cube["n"].sum()) == 4
+
+
+def test_edited_old_row_rebuilds(run):
+    run(ROWS)
+    edited = [ROWS[0][:2] + ("Positiva.",) + ROWS[0][3:]] + ROWS[1:]
+    status, n_rows, _, processed, cube = run(edited)
+    assert (status, n_rows) == ("full", 3)
+    assert processed["q3_impact"].tolist() == ["Positiva", "Positiva", "Negativa"]
+    assert int(cube.loc[cube["q3_impact"] == "Positiva", "n"].sum()) == 2
+    # The rebuilt state vouches for the edited export.
+    assert run(edited)[0] == "unchanged"
+
+
+def test_edited_old_row_with_new_rows_rebuilds(run):
+    run(ROWS)
+    edited = [ROWS[0][:4] + ("Si",)] + ROWS[1:] + [("2021-05-03 08:00:00", "Otro", "Positiva.", "No", "Si")]
+    status, n_rows, n_new, processed, _ = run(edited)
+    assert (status, n_rows, n_new) == ("full", 4, 4)
+    assert processed["q15_wellbeing_final"].tolist() == ["Si", "Si", "Tal vez", "Si"]
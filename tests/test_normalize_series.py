@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.clean_survey import (
+    normalize_basic,
+    normalize_basic_series,
+    normalize_likert,
+    normalize_likert_series,
+    normalize_text,
+    normalize_text_series,
+)
+
+
+PAIRS = [
+    (normalize_text, normalize_text_series),
+    (normalize_basic, normalize_basic_series),
+    (normalize_likert, normalize_likert_series),
+]
+
+DIRTY_TEXT = [
+    "Si",
+    "Sí",
+    " Sí ",
+    "Si.",
+    "Negativa.",
+    "  Positiva.  ",
+    "Siempre.",
+    "Mal.",
+    "De  vez\ten\ncuando",
+    "casi siempre.",
+    "CASI NUNCA",
+    "Nunca, Siempre",
+    "otro, casi nunca.",
+    "sin opcion, tampoco",
+    "",
+    "   ",
+    "\t",
+    None,
+    np.nan,
+    pd.NA,
+]
+
+COLUMNS = {
+    "dirty_text": DIRTY_TEXT,
+    "mixed_numbers": [1, 1.0, True, 0, False, 0.0, -0.0, 2.5, np.int64(3), np.float64(3.0), None, np.nan, pd.NA],
+    "mixed_with_text": ["Si", 1, " Nunca. ", 1.0, True, pd.Timestamp("2021-05-01"), "", np.nan, None],
+    "all_missing": [None, np.nan, pd.NA],
+}
+
+
+def expected(series: pd.Series, per_cell) -> list:
+    return series.map(per_cell).astype("object").tolist()
+
+
+def assert_same(actual: pd.Series, series: pd.Series, per_cell) -> None:
+    assert actual.dtype == object
+    assert actual.index.equals(series.index)
+    want = expected(series, per_cell)
+    got = actual.tolist()
+    # pd.NA does not compare equal to itself; compare missing positions and values separately.
+    assert [value is pd.NA for value in got] == [value is pd.NA for value in want]
+    assert [value for value in got if value is not pd.NA] == [value for value in want if value is not pd.NA]
+
+
+@pytest.mark.parametrize("per_cell, vectorized", PAIRS, ids=lambda fn: fn.__name__)
+@pytest.mark.parametrize("values", COLUMNS.values(), ids=COLUMNS.keys())
+def test_object_columns_match_per_cell(per_cell, vectorized, values):
+    series = pd.Series(values, dtype="object", index=np.arange(len(values)) * 3)
+    assert_same(vectorized(series), series, per_cell)
+
+
+@pytest.mark.parametrize("per_cell, vectorized", PAIRS, ids=lambda fn: fn.__name__)
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1, 2, 2, 3]),
+        pd.Series([1.0, -0.0, 0.0, np.nan]),
+        pd.Series([True, False, True]),
+        pd.Series([np.nan, np.nan]),
+        pd.Series(["Si", None, " Casi siempre "], dtype="string"),
+        pd.Series([], dtype="object"),
+    ],
+    ids=["int", "float", "bool", "float_all_nan", "string_dtype", "empty"],
+)
+def test_typed_columns_match_per_cell(per_cell, vectorized, series):
+    assert_same(vectorized(series), series, per_cell)
+
+
+def test_repeated_answers_share_one_string():
+    series = pd.Series(["Casi siempre.", "casi siempre", "Casi siempre."] * 4, dtype="object")
+    result = normalize_likert_series(series)
+    assert set(map(id, result)) == {id(result.iloc[0])}